@@ -0,0 +1,77 @@
+import pytest
+
+from bootlets import boots
+
+pytest.importorskip("pytest_benchmark")
+
+
+class FakeLabel:
+    def __init__(self, text):
+        self.text = text
+
+    def __call__(self, **kwargs):
+        return f'<label for="{self.text}">{self.text}</label>'
+
+
+class FakeField:
+    def __init__(self, name, type_="StringField"):
+        self.name = name
+        self.type = type_
+        self.label = FakeLabel(name)
+
+    def __call__(self, **kwargs):
+        attrs = "".join(f' {k.rstrip("_")}="{v}"' for k, v in kwargs.items())
+        return f'<input id="{self.name}" name="{self.name}"{attrs}>'
+
+
+class FakeForm:
+    def __init__(self, fields):
+        self.fields = fields
+
+    def __iter__(self):
+        return iter(self.fields)
+
+
+class FakePagination:
+    def __init__(self, page, pages):
+        self.page = page
+        self.pages = pages
+        self.has_prev = page > 1
+        self.has_next = page < pages
+        self.prev_num = page - 1
+        self.next_num = page + 1
+
+    def iter_pages(self, left_edge=2, left_current=2, right_current=5, right_edge=2):
+        last = 0
+        for num in range(1, self.pages + 1):
+            if (
+                num <= left_edge
+                or self.page - left_current - 1 < num < self.page + right_current
+                or num > self.pages - right_edge
+            ):
+                if last + 1 != num:
+                    yield None
+                yield num
+                last = num
+
+
+class FakeRequest:
+    args = {"q": "search"}
+
+
+def fake_url_for(endpoint, **values):
+    query = "&".join(f"{k}={v}" for k, v in values.items())
+    return f"/{endpoint}?{query}"
+
+
+@pytest.fixture
+def form():
+    fields = [FakeField(f"field_{i}") for i in range(40)]
+    fields += [FakeField("remember", "BooleanField"), FakeField("submit", "SubmitField")]
+    return FakeForm(fields)
+
+
+@pytest.fixture
+def flask_stubs(monkeypatch):
+    monkeypatch.setattr(boots, "url_for", fake_url_for)
+    monkeypatch.setattr(boots, "request", FakeRequest())
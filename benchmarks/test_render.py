@@ -0,0 +1,130 @@
+"""Benchmarks for the core rendering paths.
+
+Save a baseline and compare later runs against it with::
+
+    pytest benchmarks --benchmark-save=baseline
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+import io
+import pickle
+
+from bootlets import boots, html, serialize
+from bootlets.boots_base import Boot
+from bootlets.freeze import Slot
+
+from .conftest import FakePagination
+
+
+def deep_tree(depth=100):
+    node = html.Span("leaf")
+    for i in range(depth):
+        node = html.Div(node, class_=["level", f"level-{i}"])
+    return node
+
+
+def wide_tree(width=2000):
+    return html.Ul(*[html.Li(f"item {i}", id=f"item-{i}") for i in range(width)])
+
+
+class Widget(Boot):
+    def build_scripts(self):
+        return [html.Script(src="widget.js")]
+
+    def build(self):
+        return boots.Card(
+            boots.CardHeader(self.args[0]),
+            boots.CardBody(
+                boots.Alert("Heads up", _context="warning"),
+                boots.Badge("4"),
+                boots.Button("Go", _context="success", _size="lg"),
+            ),
+        )
+
+
+def dashboard(n=100):
+    return boots.Container(*[Widget(f"Widget {i}") for i in range(n)])
+
+
+def test_base_draw_deep(benchmark):
+    tree = deep_tree()
+    benchmark(tree.draw)
+
+
+def test_base_draw_wide(benchmark):
+    tree = wide_tree()
+    benchmark(tree.draw)
+
+
+def test_render_into_deep(benchmark):
+    tree = deep_tree()
+    benchmark(lambda: tree.render_into(io.StringIO()))
+
+
+def test_render_into_wide(benchmark):
+    tree = wide_tree()
+    benchmark(lambda: tree.render_into([]))
+
+
+def test_boot_draw(benchmark):
+    benchmark(lambda: dashboard().draw())
+
+
+def test_boot_frozen(benchmark):
+    template = Widget(Slot("title")).freeze()
+    benchmark(lambda: template.render(title="Widget"))
+
+
+def test_boot_load(benchmark):
+    benchmark(lambda: dashboard().load())
+
+
+def test_container(benchmark):
+    items = [html.P(f"paragraph {i}") for i in range(2000)]
+    benchmark(lambda: boots.Container(*items).draw())
+
+
+def test_table_large(benchmark):
+    rows = [[i, f"name {i}", i * 1.5, "yes" if i % 2 else "no"] for i in range(10000)]
+    benchmark(
+        lambda: boots.Table(_headers=["id", "name", "value", "flag"], _rows=rows).draw()
+    )
+
+
+def test_quickform(benchmark, form):
+    benchmark(lambda: boots.QuickForm(form).draw())
+
+
+def test_pagination(benchmark, flask_stubs):
+    pagination = FakePagination(page=50, pages=100)
+    benchmark(lambda: boots.Pagination(pagination, "items.index").draw())
+
+
+def test_pagination_window(benchmark, flask_stubs):
+    pagination = FakePagination(page=500000, pages=1000000)
+    benchmark(
+        lambda: boots.Pagination(pagination, "items.index", _window=True).draw()
+    )
+
+
+def test_serialize_dumps(benchmark):
+    tree = dashboard()
+    data = benchmark(lambda: serialize.dumps(tree))
+    benchmark.extra_info["bytes"] = len(data)
+    pickled = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+    benchmark.extra_info["pickle_bytes"] = len(pickled)
+
+
+def test_serialize_loads(benchmark):
+    data = serialize.dumps(dashboard())
+    benchmark(lambda: serialize.loads(data))
+
+
+def test_pickle_dumps(benchmark):
+    tree = dashboard()
+    data = benchmark(lambda: pickle.dumps(tree, pickle.HIGHEST_PROTOCOL))
+    benchmark.extra_info["bytes"] = len(data)
+
+
+def test_pickle_loads(benchmark):
+    data = pickle.dumps(dashboard(), pickle.HIGHEST_PROTOCOL)
+    benchmark(lambda: pickle.loads(data))
@@ -1,3 +1,49 @@
 __version__ = "0.0.1"
 
-from .boots_base import Boot
+import os
+from importlib import import_module
+
+# Submodules, and Boot, are imported on first access (PEP 562) so that e.g.
+# ``from bootlets import html`` doesn't import the rest of the package.
+_submodules = {
+    "aio",
+    "boots",
+    "boots_base",
+    "cache",
+    "context",
+    "decorators",
+    "diff",
+    "freeze",
+    "funcs",
+    "html",
+    "html_base",
+    "jinja",
+    "markup",
+    "options",
+    "parallel",
+    "parser",
+    "profiler",
+    "serialize",
+    "utils",
+    "whitespace",
+}
+
+
+def __getattr__(name):
+    if name == "Boot":
+        from .boots_base import Boot
+
+        return Boot
+    if name in _submodules:
+        return import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), "Boot", *_submodules])
+
+
+if os.environ.get("BOOTLETS_PROFILE"):
+    from .profiler import profile_from_env
+
+    profile_from_env()
@@ -0,0 +1,200 @@
+import asyncio
+from inspect import isawaitable
+from typing import Any, AsyncIterator, Collection, Dict, Iterable, List, Optional, Tuple
+
+from .context import collect_scripts, script_collector
+from .funcs import draw_into, draw_method, iter_draw, register_renderer, try_draw
+from .options import get_options
+
+_PLAIN = (str, int, float, bytes, type(None))
+
+
+async def aresolve(obj: Any) -> Any:
+    """Return ``obj`` with every awaitable in it awaited and every async
+    iterable collected into a list. Independent awaitables are awaited
+    concurrently; objects which need no resolving are returned unchanged."""
+    if isinstance(obj, _PLAIN) or isinstance(obj, type):
+        return obj
+    if isawaitable(obj):
+        return await aresolve(await obj)
+    if hasattr(obj, "__aiter__"):
+        tasks = [asyncio.ensure_future(aresolve(item)) async for item in obj]
+        return list(await asyncio.gather(*tasks))
+    resolver = getattr(obj, "_aresolve", None)
+    if resolver is not None:
+        return await resolver()
+    if type(obj) in (list, tuple):
+        items = await aresolve_all(obj)
+        return obj if items is obj else type(obj)(items)
+    if type(obj) is dict:
+        values = list(obj.values())
+        resolved = await aresolve_all(values)
+        return obj if resolved is values else dict(zip(obj, resolved))
+    return obj
+
+
+async def aresolve_all(items: Iterable) -> Any:
+    """Resolve each of ``items`` concurrently. Returns ``items`` itself if
+    nothing changed, otherwise a list of the resolved values."""
+    values = list(items)
+    pending = [i for i, value in enumerate(values) if not isinstance(value, _PLAIN)]
+    if not pending:
+        return items
+    results = await asyncio.gather(*[aresolve(values[i]) for i in pending])
+    changed = False
+    for i, result in zip(pending, results):
+        if result is not values[i]:
+            values[i] = result
+            changed = True
+    return values if changed else items
+
+
+async def aresolve_call(
+    args: Tuple, kwargs: Dict[str, Any], keep: Collection[str] = ()
+) -> Tuple[Tuple, Dict[str, Any], bool]:
+    """Resolve args and kwargs together, reporting whether either changed.
+    Async iterables in the kwargs named in ``keep`` are left to be streamed."""
+    names = [
+        name
+        for name, value in kwargs.items()
+        if not (name in keep and hasattr(value, "__aiter__"))
+    ]
+    values = [*args, *[kwargs[name] for name in names]]
+    resolved = await aresolve_all(values)
+    if resolved is values:
+        return args, kwargs, False
+    changed = dict(zip(names, resolved[len(args) :]))
+    kwargs = {name: changed.get(name, value) for name, value in kwargs.items()}
+    return tuple(resolved[: len(args)]), kwargs, True
+
+
+async def astream(obj: Any) -> AsyncIterator[str]:
+    """Draw ``obj`` in chunks as it resolves. Awaitables are awaited
+    concurrently as by aresolve(), but each child is yielded as soon as it and
+    the children before it are ready, and the items of an async iterable (such
+    as the rows of a Table) as they arrive."""
+    if isinstance(obj, _PLAIN) or isinstance(obj, type):
+        yield try_draw(obj)
+        return
+    if isawaitable(obj):
+        async for chunk in astream(await obj):
+            yield chunk
+        return
+    streamer = getattr(obj, "_astream", None)
+    if streamer is not None:
+        async for chunk in streamer():
+            yield chunk
+        return
+    if not get_options().whitespace:
+        if hasattr(obj, "__aiter__"):
+            first = True
+            async for item in obj:
+                if not first:
+                    yield "\n"
+                first = False
+                async for chunk in astream(item):
+                    yield chunk
+            return
+        if type(obj) in (list, tuple):
+            async for chunk in astream_children(obj):
+                yield chunk
+            return
+    yield try_draw(await aresolve(obj))
+
+
+async def astream_children(items: Iterable, sep: str = "\n") -> AsyncIterator[str]:
+    """Stream ``items`` in order and separated by ``sep``, resolving all of
+    them concurrently."""
+    collect = script_collector.get() is not None
+    parts: List[Any] = []
+    for item in items:
+        if isinstance(item, _PLAIN):
+            parts.append(try_draw(item))
+        else:
+            queue: asyncio.Queue = asyncio.Queue()
+            parts.append((queue, asyncio.ensure_future(_pump(item, queue, collect))))
+    try:
+        for i, part in enumerate(parts):
+            if i and sep:
+                yield sep
+            if isinstance(part, str):
+                yield part
+                continue
+            queue, task = part
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield chunk
+            scripts = await task
+            if scripts:
+                script_collector.get().add_drawn(scripts)
+    finally:
+        for part in parts:
+            if not isinstance(part, str):
+                part[1].cancel()
+
+
+async def _pump(obj: Any, queue: asyncio.Queue, collect: bool) -> Optional[List[str]]:
+    """Stream ``obj`` into ``queue``, followed by None. Scripts are collected
+    separately so that they are added in the order of the tree."""
+    try:
+        if not collect:
+            async for chunk in astream(obj):
+                queue.put_nowait(chunk)
+            return None
+        with collect_scripts() as scripts:
+            async for chunk in astream(obj):
+                queue.put_nowait(chunk)
+        return scripts
+    finally:
+        queue.put_nowait(None)
+
+
+class Resolved:
+    """A Boot together with its awaited build()."""
+
+    def __init__(self, boot: Any, built: Any) -> None:
+        self.boot = boot
+        self.built = built
+
+    def _collect_scripts(self) -> None:
+        collector = script_collector.get()
+        if collector is not None:
+            collector.add(self.boot.build_scripts())
+
+    def draw(self) -> str:
+        self._collect_scripts()
+        return try_draw(self.built)
+
+    def iter_draw(self):
+        self._collect_scripts()
+        yield from iter_draw(self.built)
+
+    def draw_into(self, write):
+        self._collect_scripts()
+        draw_into(self.built, write)
+
+
+register_renderer(Resolved, draw_method)
+
+
+class Drawn:
+    """The drawn HTML of a Boot from the fragment cache, with its scripts."""
+
+    def __init__(self, content: str, scripts: Tuple[str, ...]) -> None:
+        self.content = content
+        self.scripts = scripts
+
+    def draw(self) -> str:
+        collector = script_collector.get()
+        if self.scripts and collector is not None:
+            collector.add_drawn(self.scripts)
+        return self.content
+
+
+register_renderer(Drawn, draw_method)
+
+
+async def adraw(obj: Any) -> str:
+    return try_draw(await aresolve(obj))
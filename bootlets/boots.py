@@ -1,44 +1,83 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
 from . import html
 from .boots_base import Boot
-from .funcs import try_draw
+from .funcs import draw_method, register_renderer, try_draw
+from .markup import Markup
+from .options import get_options
+from .whitespace import INDENT, indent_level
+
+
+# WTForms and Flask are imported on first use rather than with bootlets, so
+# that using the components without them doesn't cost their import time.
+
+def is_hidden_field_filter(field):
+    return _is_hidden_field_class(type(field))
+
+
+@lru_cache(maxsize=None)
+def _is_hidden_field_class(cls):
+    try:
+        from wtforms.fields import HiddenField
+    except ImportError:
+        raise RuntimeError("WTForms is not installed.")
+    return issubclass(cls, HiddenField)
 
 
-def raise_runtime_error(msg):
-    def inner(*args, **kwargs):
-        raise RuntimeError(msg)
-    return inner
+def url_for(*args, **kwargs):
+    try:
+        from flask import url_for
+    except ImportError:
+        raise RuntimeError("Flask is not installed.")
+    return url_for(*args, **kwargs)
 
-try:
-    from wtforms.fields import HiddenField
-except ImportError:
-    is_hidden_field_filter = raise_runtime_error("WTForms is not installed.")
-else:
-    def is_hidden_field_filter(field):
-        return isinstance(field, HiddenField)
 
-try:
-    from flask import url_for, request
-except ImportError:
-    url_for = raise_runtime_error("Flask is not installed.")
-    request = raise_runtime_error("Flask is not installed.")
+class _FlaskRequest:
+    def __getattr__(self, name):
+        try:
+            from flask import request
+        except ImportError:
+            raise RuntimeError("Flask is not installed.")
+        return getattr(request, name)
+
+
+request = _FlaskRequest()
 
 
 
 
 class Container(Boot):
-    defaults = {"_inline": False}
+    defaults = {"_inline": False, "_parallel": None}
     _block = "{content}"
 
+    def get_parallel(self):
+        renderer = self.get("_parallel")
+        if not renderer:
+            return None
+
+        from .parallel import default_renderer
+
+        if renderer is True:
+            return default_renderer()
+        if isinstance(renderer, str):
+            return default_renderer(renderer)
+        return renderer
+
     def build(self):
+        renderer = self.get_parallel()
+        if renderer is not None:
+            from .parallel import ParallelGroup
+
+            return ParallelGroup(self.args, renderer, " " if self.get("_inline") else "\n")
         if self.get("_inline"):
-            joinstr = " "
-        else:
-            joinstr = "\n"
-        return joinstr.join([try_draw(item) for item in self])
+            return html.InlineFragment(*self)
+        return html.Fragment(*self)
 
 
 class Alert(Boot):
     _class = "alert"
+    cache_class = True
     defaults = {"_context": "primary", "role": "alert"}
 
     def build_classes(self):
@@ -64,12 +103,13 @@ class AlertDismissButton(Boot):
 
     def build(self):
         return html.Button(
-            html.Span("&times;", aria_hidden="true"), **self.get_kwargs()
+            html.Span(Markup("&times;"), aria_hidden="true"), **self.get_kwargs()
         )
 
 
 class Badge(Boot):
     _class = "badge"
+    cache_class = True
     defaults = {"_context": "primary"}
 
     def get_class(self):
@@ -99,6 +139,7 @@ class LinkBadge(Boot):
 
 class BreadcrumbItem(Boot):
     _class = "breadcrumb-item"
+    cache_class = True
     defaults = {"_active": False}
 
     def build_classes(self):
@@ -125,6 +166,7 @@ class Breadcrumb(Boot):
 
 
 class Button(Boot):
+    cache_class = True
     defaults = {
         "_context": "primary",
         "_size": "md",
@@ -156,6 +198,7 @@ class Button(Boot):
 
 
 class ButtonLink(Boot):
+    cache_class = True
     defaults = {
         "_context": "primary",
         "_size": "md",
@@ -187,6 +230,7 @@ class ButtonLink(Boot):
 
 
 class ButtonGroup(Boot):
+    cache_class = True
     defaults = {
         "_vertical": False,
         "role": "group",
@@ -286,6 +330,7 @@ class DescriptionList(Boot):
 
 class ListGroup(Boot):
     _class = "list-group"
+    cache_class = True
     Li = html.Li
     defaults = {"_flush": False, "_li_class": "list-group-item"}
 
@@ -348,75 +393,242 @@ class DropdownButton(Boot):
         return html.Button(*self.args, **self.get_kwargs())
 
 
+class TableRows:
+    """The rows of a Table, drawn straight from the data without creating a
+    node for every cell.
+
+    ``rows`` may be any iterable of rows (including a generator, which is
+    consumed as the rows are drawn), a 2-D NumPy array, a record array or a
+    pandas DataFrame. ``formatters`` maps a column index or header to a
+    function which is applied to each value in that column before drawing.
+    """
+
+    def __init__(self, rows, formatters=None, headers=()):
+        self.rows = rows
+        self.formatters = formatters or {}
+        self.headers = list(headers)
+
+    def iter_rows(self):
+        rows = self.rows
+        if hasattr(rows, "itertuples"):  # pandas.DataFrame
+            return rows.itertuples(index=False, name=None)
+        if hasattr(rows, "tolist"):  # numpy.ndarray / numpy.recarray
+            return iter(rows.tolist())
+        return iter(rows)
+
+    def get_formatters(self, width):
+        formatters = []
+        for i in range(width):
+            formatter = self.formatters.get(i)
+            if formatter is None and i < len(self.headers):
+                formatter = self.formatters.get(self.headers[i])
+            formatters.append(formatter)
+        return formatters
+
+    def get_separators(self):
+        """The row separator, the start and end of a row and the cell
+        separator and end for the whitespace option."""
+        whitespace = get_options().whitespace
+        if whitespace == "minify":
+            return "", "<tr>", "", "", ""
+        if whitespace == "pretty":
+            depth = indent_level.get()
+            row = "\n" + INDENT * depth
+            cell = row + INDENT
+            return row, "<tr>" + cell, row + "</tr>", cell, "</td>"
+        return "\n", "<tr>", "</tr>", "\n", "</td>"
+
+    def row_drawer(self):
+        """A function drawing the i-th row, with the separator before it."""
+        row_sep, row_start, row_end, cell_sep, cell_end = self.get_separators()
+        formatters = []
+
+        def draw_row(i, row):
+            nonlocal formatters
+            if len(formatters) < len(row):
+                formatters = self.get_formatters(len(row))
+            return (row_sep if i else "") + row_start + cell_sep.join(
+                [
+                    "<td>" + try_draw(value if f is None else f(value)) + cell_end
+                    for f, value in zip(formatters, row)
+                ]
+            ) + row_end
+
+        return draw_row
+
+    def iter_draw(self):
+        draw_row = self.row_drawer()
+        for i, row in enumerate(self.iter_rows()):
+            yield draw_row(i, row)
+
+    async def _aresolve(self):
+        from .aio import aresolve
+
+        rows = await aresolve(self.rows)
+        if rows is self.rows:
+            return self
+        return TableRows(rows, self.formatters, self.headers)
+
+    async def _astream(self):
+        from .aio import aresolve
+
+        if not hasattr(self.rows, "__aiter__"):
+            for chunk in (await self._aresolve()).iter_draw():
+                yield chunk
+            return
+        draw_row = self.row_drawer()
+        i = 0
+        async for row in self.rows:
+            yield draw_row(i, await aresolve(row))
+            i += 1
+
+    def draw(self):
+        return "".join(self.iter_draw())
+
+    def draw_into(self, write):
+        for row in self.iter_draw():
+            write(row)
+
+
+register_renderer(TableRows, draw_method)
+
+
 class Table(Boot):
     _class = "table table-hover"
+    stream_kwargs = ("_rows",)
 
     defaults = {
         "_headers": [],
         "_rows": [],
+        "_formatters": {},
         "_hover": True,
     }
 
+    def get_headers(self):
+        headers = self.get("_headers")
+        if headers is not None and len(headers):  # May be an Index or array
+            return list(headers)
+        rows = self.get("_rows")
+        if hasattr(rows, "columns"):  # pandas.DataFrame
+            return list(rows.columns)
+        names = getattr(getattr(rows, "dtype", None), "names", None)
+        if names:  # numpy record array
+            return list(names)
+        return []
+
     def build(self):
+        header_names = self.get_headers()
         headers = html.THead(
-            html.Tr(*[html.Th(i, scope="col") for i in self.get("_headers")])
+            html.Tr(*[html.Th(i, scope="col") for i in header_names])
         )
         rows = html.TBody(
-            *[html.Tr(*[html.Td(i) for i in row]) for row in self.get("_rows")]
+            TableRows(self.get("_rows"), self.get("_formatters"), header_names)
         )
 
         return html.Table(headers, rows, **self.get_kwargs())
 
 
-class FormField(Boot):
-    defaults = {
-        "_form_type": "basic",
-        "_button_map": {},
-    }
+# Form fields are drawn by a builder chosen once per WTForms field class from
+# the field's type, rather than by going through every type on each draw.
+# Builders are called with the field and the button classes of the form.
 
-    def build(self):
-        field = self.args[0]
+FieldBuilder = Callable[[Any, Dict[str, str]], Any]
 
-        if field.type == "SubmitField":
-            btn_cls = self.get("_button_map").get(field.name, "primary")
-            return field(class_=f"btn btn-{btn_cls}")
-            # return html.Button(class_=f'btn btn-{btn_cls}')
+field_builders: Dict[str, FieldBuilder] = {}
+_field_dispatch: Dict[Tuple[type, str], FieldBuilder] = {}
 
-        elif field.type == "RadioField":
-            return Container(
-                *[html.Div(class_="form-check")(item(), item.label()) for item in field]
-            )
 
-        elif field.type == "FormField":
-            return html.FieldSet()(
-                html.Legend()(field.label),
-                *[
-                    FormField(
-                        item,
-                        _form_type=self.get("_form_type"),
-                        _button_map=self.get("_button_map"),
-                    )
-                    for item in field
-                    if not is_hidden_field_filter(item)
-                ],
-            )
+def register_field_builder(type_name: str, builder: Optional[FieldBuilder] = None):
+    """Register the function building fields whose ``type`` is ``type_name``.
+    Can also be used as a decorator."""
 
-        elif field.type == "BooleanField":
-            return html.Div(class_="form-group form-check")(
-                field(class_="form-check-input"), field.label(class_="form-check-label")
-            )
+    def register(builder: FieldBuilder) -> FieldBuilder:
+        field_builders[type_name] = builder
+        _field_dispatch.clear()
+        return builder
 
-        elif field.type == "FileField" or field.type == "MultiplFileField":
-            return html.Div(class_="form-group")(
-                field.label(), field(class_="form-control-file")
-            )
+    if builder is None:
+        return register
+    return register(builder)
 
-        else:
-            if is_hidden_field_filter(field):
-                return html.Div(class_="form-group")(field())
-            return html.Div(class_="form-group")(
-                field.label(), field(class_="form-control")
-            )
+
+def get_field_builder(field) -> FieldBuilder:
+    # Keyed on the type name too, as fields needn't have a class per type
+    key = (type(field), field.type)
+    builder = _field_dispatch.get(key)
+    if builder is None:
+        builder = field_builders.get(field.type)
+        if builder is None:
+            builder = build_hidden if is_hidden_field_filter(field) else build_input
+        _field_dispatch[key] = builder
+    return builder
+
+
+def build_field(field, buttons: Dict[str, str]):
+    return get_field_builder(field)(field, buttons)
+
+
+def button_classes(button_map: Dict[str, str]) -> Dict[str, str]:
+    return {name: f"btn btn-{cls}" for name, cls in button_map.items()}
+
+
+@register_field_builder("SubmitField")
+def build_submit(field, buttons):
+    return field(class_=buttons.get(field.name, "btn btn-primary"))
+
+
+@register_field_builder("RadioField")
+def build_radio(field, buttons):
+    return html.Fragment(
+        *[html.Div(item(), item.label(), class_="form-check") for item in field]
+    )
+
+
+@register_field_builder("FormField")
+def build_subform(field, buttons):
+    return html.FieldSet(
+        html.Legend(field.label),
+        *[
+            build_field(item, buttons)
+            for item in field
+            if not is_hidden_field_filter(item)
+        ],
+    )
+
+
+@register_field_builder("BooleanField")
+def build_boolean(field, buttons):
+    return html.Div(
+        field(class_="form-check-input"),
+        field.label(class_="form-check-label"),
+        class_="form-group form-check",
+    )
+
+
+@register_field_builder("FileField")
+@register_field_builder("MultiplFileField")
+def build_file(field, buttons):
+    return html.Div(
+        field.label(), field(class_="form-control-file"), class_="form-group"
+    )
+
+
+def build_hidden(field, buttons):
+    return html.Div(field(), class_="form-group")
+
+
+def build_input(field, buttons):
+    return html.Div(field.label(), field(class_="form-control"), class_="form-group")
+
+
+class FormField(Boot):
+    defaults = {
+        "_form_type": "basic",
+        "_button_map": {},
+    }
+
+    def build(self):
+        return build_field(self.args[0], button_classes(self.get("_button_map")))
 
 
 class QuickForm(Boot):
@@ -435,19 +647,9 @@ class QuickForm(Boot):
     }
 
     def build(self):
-        form = self.args[0]
+        buttons = button_classes(self.get("_button_map"))
         return html.Form(
-            Container(
-                *[
-                    FormField(
-                        field,
-                        _form_type=self.get("_form_type"),
-                        _columns=self.get("_columns"),
-                        _button_map=self.get("_button_map"),
-                    )
-                    for field in form
-                ]
-            )
+            html.Fragment(*[build_field(field, buttons) for field in self.args[0]])
         )
 
 
@@ -476,7 +678,7 @@ class Modal(Boot):
                             class_="close",
                             data_bs_dismiss="modal",
                             aria_label="Close",
-                        )(html.Span(aria_hidden="true")("&times;")),
+                        )(html.Span(aria_hidden="true")(Markup("&times;"))),
                     ),
                     html.Div(class_="modal-body")(*self.args),
                     self.get_footer(),
@@ -521,51 +723,94 @@ class ModalLink(Boot):
         )(*self.args)
 
 
+def window_pages(
+    page, pages, left_edge=2, left_current=2, right_current=5, right_edge=2
+):
+    """The page numbers yielded by ``iter_pages()`` of a Flask-SQLAlchemy
+    pagination, with None for each gap, computed from the edges of the
+    window instead of by testing every page."""
+    ranges = [
+        (1, left_edge),
+        (page - left_current, page + right_current - 1),
+        (pages - right_edge + 1, pages),
+    ]
+    last = 0
+    for start, stop in sorted(ranges):
+        start = max(start, last + 1, 1)
+        stop = min(stop, pages)
+        if start > stop:
+            continue
+        if start != last + 1:
+            yield None
+        yield from range(start, stop + 1)
+        last = stop
+
+
+# A page number which stands in for every page when building the URL
+# template, large enough not to collide with anything else in the URL
+_PAGE_SENTINEL = 918273645546372819
+
+
 class Pagination(Boot):
     def init(self, *args, **kwargs):
         self.pagination = args[0]
         self.endpoint = args[1]
+        self._url_template = None
 
     defaults = {
         "_label": "Pagination",
         "_request_param": "page",
         "_url_kwargs": {},
         "_fragment": "",
+        "_window": None,
     }
 
+    def url_for_page(self, page):
+        return url_for(
+            self.endpoint,
+            **{
+                **request.args,
+                **{self.get("_request_param"): page},
+                **self.get("_url_kwargs"),
+            },
+        )
+
+    def get_url_template(self):
+        """The URL of a page split around its page number, or False if the
+        page number cannot be substituted, e.g. because _url_kwargs sets it."""
+        if self._url_template is None:
+            url = self.url_for_page(_PAGE_SENTINEL)
+            parts = url.split(str(_PAGE_SENTINEL))
+            self._url_template = tuple(parts) if len(parts) == 2 else False
+        return self._url_template
+
+    def get_url(self, page):
+        template = self.get_url_template()
+        if template:
+            return f"{template[0]}{page}{template[1]}"
+        return self.url_for_page(page)
+
     def get_prev_endpoint(self):
         if self.pagination.has_prev:
-            return (
-                url_for(
-                    self.endpoint,
-                    **{
-                        **request.args,
-                        **{self.get("_request_param"): self.pagination.prev_num},
-                        **self.get("_url_kwargs"),
-                    },
-                )
-                + self.get("_fragment")
-            )
+            return self.get_url(self.pagination.prev_num) + self.get("_fragment")
         return "#"
 
     def get_next_endpoint(self):
         if self.pagination.has_next:
-            return (
-                url_for(
-                    self.endpoint,
-                    **{
-                        **request.args,
-                        **{self.get("_request_param"): self.pagination.next_num},
-                        **self.get("_url_kwargs"),
-                    },
-                )
-                + self.get("_fragment")
-            )
+            return self.get_url(self.pagination.next_num) + self.get("_fragment")
         return "#"
 
+    def iter_pages(self):
+        window = self.get("_window")
+        if not window:
+            return self.pagination.iter_pages()
+        if window is True:
+            window = ()
+        return window_pages(self.pagination.page, self.pagination.pages, *window)
+
     def get_pages(self):
         page_list_items = []
-        for page in self.pagination.iter_pages():
+        for page in self.iter_pages():
             if page is not None:
                 if page == self.pagination.page:
                     page_list_items.append(
@@ -576,18 +821,7 @@ class Pagination(Boot):
                 else:
                     page_list_items.append(
                         html.Li(class_="page-item")(
-                            html.A(
-                                page,
-                                class_="page-link",
-                                href=url_for(
-                                    self.endpoint,
-                                    **{
-                                        **request.args,
-                                        **{self.get("_request_param"): page},
-                                        **self.get("_url_kwargs"),
-                                    },
-                                ),
-                            )
+                            html.A(page, class_="page-link", href=self.get_url(page))
                         )
                     )
 
@@ -596,14 +830,14 @@ class Pagination(Boot):
             prev_page_list_item_class += " disabled"
 
         prev_page_list_item = html.Li(class_=prev_page_list_item_class)(
-            html.A("&laquo", class_="page-link", href=self.get_prev_endpoint())
+            html.A(Markup("&laquo"), class_="page-link", href=self.get_prev_endpoint())
         )
 
         next_page_list_item_class = "page-item"
         if not self.pagination.has_next:
             next_page_list_item_class += " disabled"
         next_page_list_item = html.Li(class_=next_page_list_item_class)(
-            html.A("&raquo", class_="page-link", href=self.get_next_endpoint())
+            html.A(Markup("&raquo"), class_="page-link", href=self.get_next_endpoint())
         )
 
         return [prev_page_list_item, *page_list_items, next_page_list_item]
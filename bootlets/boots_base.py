@@ -1,13 +1,41 @@
+from inspect import isawaitable, iscoroutinefunction
 from logging import getLogger
-from functools import lru_cache
+from typing import Any, AsyncIterator, Collection
 
-from .funcs import list_to_str, try_draw
+from .cache import BuildCache, InternCache, fragment_cache, options_key, register_cache
+from .context import collect_scripts, script_collector
+from .funcs import (
+    buffered,
+    draw_into,
+    draw_method,
+    iter_draw,
+    list_to_str,
+    register_renderer,
+    render_into,
+    try_draw,
+)
+from .freeze import FrozenTemplate, freeze, freezing
 from .html import Div
+from .markup import Markup
 
 
 class Boot:
     defaults = {}
     _class = ""
+    build_cache = BuildCache(maxsize=1024)
+    class_cache = InternCache()
+    cache_class = True
+    cache_fragment = False
+    stream_kwargs = ()  # Kwargs whose async iterables astream() passes on
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Classes overriding get_class() or build_classes() may use args or
+        # other state, so they have to opt in to the class cache.
+        if "cache_class" not in vars(cls) and (
+            "get_class" in vars(cls) or "build_classes" in vars(cls)
+        ):
+            cls.cache_class = False
 
     def __init__(self, *args, **kwargs) -> None:
         self.logger = getLogger(self.__class__.__name__)
@@ -48,7 +76,7 @@ class Boot:
             if key.startswith("_"):
                 continue
             if key == "class_":
-                value = self.get_class()
+                value = self._get_class()
             else:
                 key = key.replace("_", "-")
                 value = list_to_str(value)
@@ -57,11 +85,20 @@ class Boot:
                 key = "for"
             kwargs[key] = value
         if "class_" not in kwargs:
-            c = self.get_class()
+            c = self._get_class()
             if c:
                 kwargs["class_"] = c
         return kwargs
 
+    def _get_class(self) -> str:
+        """get_class(), built once per class and set of kwargs when the class
+        sets ``cache_class``, i.e. when get_class() and build_classes() depend
+        on nothing else."""
+        key = options_key(self.kwargs) if self.cache_class else None
+        if key is None:
+            return self.get_class()
+        return self.class_cache.get((self.__class__, key), self.get_class)
+
     def build_classes(self) -> str:
         return ""
 
@@ -71,21 +108,139 @@ class Boot:
     def build(self):
         return Div(*self.args, **self.get_kwargs())
 
-    @lru_cache(maxsize=None)
     def _build(self):
-        return self.build()
+        if freezing():  # Slots may have been drawn into the build
+            return self.build()
+        return self.build_cache.get(self, self.build)
 
     def draw(self) -> str:
+        if self.kwargs.get("_cache", self.cache_fragment):
+            return fragment_cache.get_or_draw(self, self._draw)
+        return self._draw()
+
+    def _draw(self) -> str:
+        collector = script_collector.get()
+        if collector is not None:
+            collector.add(self.build_scripts())
         return try_draw(self._build())
 
+    def iter_draw(self):
+        if self.kwargs.get("_cache", self.cache_fragment):
+            yield self.draw()
+            return
+        collector = script_collector.get()
+        if collector is not None:
+            collector.add(self.build_scripts())
+        yield from iter_draw(self._build())
+
+    def stream(self, size: int = 8192):
+        return buffered(self.iter_draw(), size)
+
+    def draw_into(self, write):
+        if self.kwargs.get("_cache", self.cache_fragment):
+            write(self.draw())
+            return
+        collector = script_collector.get()
+        if collector is not None:
+            collector.add(self.build_scripts())
+        draw_into(self._build(), write)
+
+    def render_into(self, writer):
+        return render_into(self, writer)
+
+    def freeze(self) -> FrozenTemplate:
+        """Draw once into a template whose Slot values are filled by render()."""
+        return freeze(self)
+
+    async def abuild(self):
+        """Await the args, build() (which may be a coroutine) and any
+        awaitables in the built tree."""
+        from .aio import aresolve
+
+        obj = await self._aresolve_args()
+        return await aresolve(await obj._abuild())
+
+    async def adraw(self) -> str:
+        return try_draw(await self._aresolve())
+
+    async def astream(self) -> AsyncIterator[str]:
+        """Draw in chunks as the tree resolves, see aio.astream()."""
+        from .aio import astream
+
+        async for chunk in astream(self):
+            yield chunk
+
+    async def _aresolve_args(self, keep: Collection[str] = ()) -> "Boot":
+        """This Boot, or a copy of it with its args and kwargs awaited."""
+        from .aio import aresolve_call
+
+        args, kwargs, changed = await aresolve_call(self.args, self.kwargs, keep)
+        return self.__class__(*args, **kwargs) if changed else self
+
+    async def _aresolve(self) -> Any:
+        from .aio import Drawn, Resolved, aresolve
+
+        obj = await self._aresolve_args()
+        if not obj.kwargs.get("_cache", obj.cache_fragment):
+            return Resolved(obj, await aresolve(await obj._abuild()))
+        key, entry = fragment_cache.lookup(obj)
+        if entry is None:
+            resolved = Resolved(obj, await aresolve(await obj._abuild()))
+            with collect_scripts() as scripts:
+                entry = (try_draw(resolved), tuple(scripts))
+            if key is not None:
+                fragment_cache.store(key, entry)
+        return Drawn(*entry)
+
+    async def _abuild(self) -> Any:
+        """build(), awaited if it is async and from the build cache if not."""
+        if iscoroutinefunction(self.build):
+            return await self.build()
+        built = self._build()
+        if isawaitable(built):  # Can only be awaited once, so not cached
+            self.build_cache.discard(self)
+            built = await built
+        return built
+
+    async def _astream(self) -> AsyncIterator[str]:
+        from .aio import astream
+
+        if self.kwargs.get("_cache", self.cache_fragment):
+            yield try_draw(await self._aresolve())
+            return
+        obj = await self._aresolve_args(self.stream_kwargs)
+        built = await obj._abuild()
+        collector = script_collector.get()
+        if collector is not None:
+            collector.add(obj.build_scripts())
+        async for chunk in astream(built):
+            yield chunk
+
     def load(self):
         from .boots import Container
 
-        content = self._build()
-        scripts = try_get_scripts(content)
-        if isinstance(content, (list, tuple)):
-            content = Container(*content)
-        return content, Container(*scripts)
+        with collect_scripts() as scripts:
+            content = self.draw()
+        return Container(Markup(content)), Container(*map(Markup, scripts))
+
+    def _fragment_state(self) -> tuple:
+        return self.args, self.kwargs
+
+    def _state(self) -> Any:
+        """The attributes set on the instance other than its logger, args and
+        kwargs, as the state pickle takes, or None if there are none."""
+        state = {
+            name: value
+            for name, value in self.__dict__.items()
+            if name not in _RESTORED
+        }
+        return state or None
+
+    def __reduce__(self):  # Pickle as (class, args, kwargs), without the logger
+        state = self._state()
+        if state is None:
+            return _restore, (self.__class__, self.args, self.kwargs)
+        return _restore, (self.__class__, self.args, self.kwargs), state
 
     def __repr__(self) -> str:
         s = self.__class__.__qualname__ + "("
@@ -99,25 +254,19 @@ class Boot:
         return s
 
 
-def try_get_scripts(obj):
-    scripts = []
-
-    try:
-        obj_scripts = obj.build_scripts()
-        if isinstance(obj_scripts, (list, tuple)):
-            scripts += obj.build_scripts()
-        else:
-            scripts.append(obj_scripts)
-    except AttributeError:
-        pass
+_RESTORED = frozenset(["logger", "args", "kwargs"])
 
-    if isinstance(obj, (list, tuple, Boot)):
-        for child in obj:
-            scripts += try_get_scripts(child)
 
-    try:
-        scripts += try_get_scripts(obj._build())
-    except AttributeError:
-        pass
+def _restore(cls, args, kwargs):
+    return cls(*args, **kwargs)
+
 
+register_renderer(Boot, draw_method)
+register_cache("build", lambda: Boot.build_cache.info())
+register_cache("classes", lambda: Boot.class_cache.info())
+
+
+def try_get_scripts(obj):
+    with collect_scripts() as scripts:
+        try_draw(obj)
     return scripts
@@ -0,0 +1,419 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Tuple
+from weakref import ref
+
+from .context import collect_scripts, script_collector
+from .whitespace import render_state
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+_caches: Dict[str, Callable[[], CacheInfo]] = {}
+
+
+def register_cache(name: str, info: Callable[[], CacheInfo]) -> None:
+    """Report the statistics returned by ``info`` in cache_info()."""
+    _caches[name] = info
+
+
+def cache_info() -> Dict[str, CacheInfo]:
+    return {name: info() for name, info in _caches.items()}
+
+
+class BuildCache:
+    """Memoizes ``Boot.build()`` per instance without keeping instances alive.
+
+    Entries are keyed on the instance and dropped as soon as it is garbage
+    collected. If ``maxsize`` is set, the least recently used entries are
+    evicted once the cache grows past it; ``maxsize=0`` disables caching.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, obj: Any, build: Callable[[], Any]) -> Any:
+        key = id(obj)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is obj:
+                self.hits += 1
+                if self.maxsize is not None:
+                    self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+
+        value = build()
+        if self.maxsize == 0:
+            return value
+
+        # Dropped entries are only released once the lock is: freeing a built
+        # tree can free cached Boots in it, whose callbacks take the lock.
+        evicted = []
+        with self._lock:
+            self._entries[key] = (ref(obj, self._remover(key)), value)
+            self._entries.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    evicted.append(self._entries.popitem(last=False))
+                    self.evictions += 1
+        del evicted
+        return value
+
+    def _remover(self, key: int) -> Callable:
+        self_ref = ref(self)
+
+        def remove(wr):
+            cache = self_ref()
+            if cache is None:
+                return
+            entry = None
+            with cache._lock:
+                entry = cache._entries.get(key)
+                if entry is not None and entry[0] is wr:
+                    del cache._entries[key]
+            del entry
+
+        return remove
+
+    def discard(self, obj: Any) -> None:
+        entry = None
+        with self._lock:
+            entry = self._entries.get(id(obj))
+            if entry is not None and entry[0]() is obj:
+                del self._entries[id(obj)]
+        del entry
+
+    def clear(self) -> None:
+        with self._lock:
+            entries, self._entries = self._entries, OrderedDict()
+            self.hits = self.misses = self.evictions = 0
+        del entries
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+
+###################################################################################################
+# Interned attribute strings
+
+_PLAIN = frozenset([str, int, float, bool, type(None)])
+
+
+def options_key(options: Dict[str, Any]) -> Optional[tuple]:
+    """A key for the options of a component which tells apart equal values of
+    different types, such as 1 and True or a str and Markup, or None if any
+    value is not plain data."""
+    types = tuple(map(type, options.values()))
+    if not _PLAIN.issuperset(types):
+        return None
+    return tuple(options.items()), types
+
+
+class InternCache:
+    """Strings built from the class and options of a component, such as its
+    attributes, so that each is built once per distinct set of options and
+    the one copy is shared wherever it is drawn.
+
+    Once there are ``maxsize`` entries the oldest is dropped for each new one.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: Dict[Any, str] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any, build: Callable[[], str]) -> str:
+        value = self._entries.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        value = build()
+        with self._lock:
+            self.misses += 1
+            if self.maxsize:
+                if len(self._entries) >= self.maxsize:
+                    del self._entries[next(iter(self._entries))]
+                    self.evictions += 1
+                self._entries[key] = value
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, self.maxsize, len(self._entries)
+        )
+
+
+###################################################################################################
+# Fragment cache
+#
+# Backends store entries of (html, scripts), where scripts holds the drawn
+# build_scripts() of every Boot in the fragment so that load() still sees
+# them when the fragment comes from the cache.
+
+Entry = Tuple[str, Tuple[str, ...]]
+
+
+class Uncacheable(TypeError):
+    pass
+
+
+def _canonical(obj: Any, out: List[str]) -> None:
+    cls = type(obj)
+    if obj is None or isinstance(obj, (str, int, float, bytes)):
+        out.append(f"{cls.__qualname__}:{obj!r}")
+    elif isinstance(obj, (list, tuple)):
+        out.append(f"{cls.__qualname__}(")
+        for item in obj:
+            _canonical(item, out)
+            out.append(",")
+        out.append(")")
+    elif isinstance(obj, dict):
+        items = []
+        for key, value in obj.items():
+            item = [repr(key), ":"]
+            _canonical(value, item)
+            items.append("".join(item))
+        out.append("{" + ",".join(sorted(items)) + "}")
+    elif hasattr(obj, "_fragment_state"):
+        out.append(f"{cls.__module__}.{cls.__qualname__}(")
+        _canonical(obj._fragment_state(), out)
+        out.append(")")
+    else:
+        raise Uncacheable(f"Cannot derive a fragment key from {cls.__qualname__}")
+
+
+_blake2b: Optional[Callable[..., Any]] = None
+
+
+def fragment_key(obj: Any) -> str:
+    """A digest of the render options and of the class, args and kwargs of
+    ``obj`` and, recursively, of any components in them. Raises Uncacheable
+    for values it cannot key."""
+    global _blake2b
+    if _blake2b is None:
+        from hashlib import blake2b as _blake2b  # Not imported with bootlets
+
+    out = [repr(render_state())]
+    _canonical(obj, out)
+    return _blake2b("".join(out).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _entry_size(entry: Entry) -> int:
+    return len(entry[0]) + sum(len(script) for script in entry[1])
+
+
+class LRUBackend:
+    """In-process store with LRU eviction by entry count and total size."""
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.evictions = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and expires < monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Entry) -> None:
+        expires = monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (expires, value)
+            self.size += _entry_size(value)
+            while self._entries and (
+                (self.maxsize is not None and len(self._entries) > self.maxsize)
+                or (self.max_bytes is not None and self.size > self.max_bytes)
+            ):
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _pop(self, key: str) -> None:
+        _, value = self._entries.pop(key)
+        self.size -= _entry_size(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class SharedDictBackend:
+    """Store entries in a mapping shared between processes, such as a
+    ``multiprocessing.Manager().dict()``.
+
+    Eviction is first in, first out: reads aren't written back to the
+    mapping, so there is no shared recency to evict by. Once the mapping
+    grows past ``maxsize``, expired entries and the oldest tenth of it are
+    evicted together, so that it is only sorted once per batch.
+    """
+
+    def __init__(
+        self,
+        mapping: MutableMapping,
+        maxsize: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        self.mapping = mapping
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def __len__(self) -> int:
+        return len(self.mapping)
+
+    def get(self, key: str) -> Optional[Entry]:
+        entry = self.mapping.get(key)
+        if entry is None:
+            return None
+        expires, value = entry[0], entry[2]
+        if expires is not None and expires < time():
+            self.mapping.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Entry) -> None:
+        now = time()
+        expires = now + self.ttl if self.ttl is not None else None
+        self.mapping[key] = (expires, now, value)
+        if self.maxsize is not None and len(self.mapping) > self.maxsize:
+            self.evict(now)
+
+    def evict(self, now: float) -> None:
+        entries = sorted(self.mapping.items(), key=lambda item: item[1][1])
+        excess = len(entries) - (self.maxsize - self.maxsize // 10)
+        for key, (expires, _, _) in entries:
+            if excess > 0 or (expires is not None and expires < now):
+                self.mapping.pop(key, None)
+                excess -= 1
+
+    def clear(self) -> None:
+        self.mapping.clear()
+
+
+class RedisBackend:
+    """Store entries through a Redis client (or any object with compatible
+    ``get``/``set(..., ex=)``/``delete`` methods, e.g. fakeredis)."""
+
+    def __init__(
+        self, client: Any, prefix: str = "bootlets:", ttl: Optional[int] = None
+    ) -> None:
+        import json  # Only needed with Redis, so not imported with bootlets
+
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self._json = json
+
+    def get(self, key: str) -> Optional[Entry]:
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            return None
+        content, scripts = self._json.loads(value)
+        return content, tuple(scripts)
+
+    def set(self, key: str, value: Entry) -> None:
+        self.client.set(self.prefix + key, self._json.dumps(value), ex=self.ttl)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+
+class FragmentCache:
+    """Returns previously drawn HTML for components drawn with the same
+    class, args and kwargs."""
+
+    def __init__(self, backend: Any) -> None:
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    def get_or_draw(self, obj: Any, draw: Callable[[], str]) -> str:
+        key, entry = self.lookup(obj)
+        if key is None:
+            return draw()
+        if entry is None:
+            with collect_scripts() as scripts:
+                entry = (draw(), tuple(scripts))
+            self.store(key, entry)
+        content, scripts = entry
+        collector = script_collector.get()
+        if scripts and collector is not None:
+            collector.add_drawn(scripts)
+        return content
+
+    def lookup(self, obj: Any) -> Tuple[Optional[str], Optional[Entry]]:
+        """The key of ``obj`` (None if it is uncacheable) and its entry, if
+        it has been drawn before."""
+        try:
+            key = fragment_key(obj)
+        except Uncacheable:
+            self.uncacheable += 1
+            return None, None
+        entry = self.backend.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return key, entry
+
+    def store(self, key: str, entry: Entry) -> None:
+        self.backend.set(key, entry)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            getattr(self.backend, "evictions", 0),
+            getattr(self.backend, "maxsize", None),
+            len(self.backend) if hasattr(self.backend, "__len__") else None,
+        )
+
+
+fragment_cache = FragmentCache(LRUBackend())
+register_cache("fragment", fragment_cache.info)
+
+
+def set_fragment_backend(backend: Any) -> None:
+    fragment_cache.backend = backend
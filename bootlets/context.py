@@ -0,0 +1,42 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterable, Iterator, List, Optional
+
+from .funcs import try_draw
+
+
+class ScriptCollector:
+    """Collects the drawn output of ``Boot.build_scripts()`` in the order the
+    components are drawn, without duplicates."""
+
+    def __init__(self) -> None:
+        self.scripts: List[str] = []
+        self._seen = set()
+
+    def add(self, scripts: Any) -> None:
+        if not isinstance(scripts, (list, tuple)):
+            scripts = [scripts]
+        self.add_drawn([try_draw(script) for script in scripts if script is not None])
+
+    def add_drawn(self, scripts: Iterable[str]) -> None:
+        """Add scripts which have already been drawn, e.g. from a cache."""
+        for script in scripts:
+            if script and script not in self._seen:
+                self._seen.add(script)
+                self.scripts.append(script)
+
+
+script_collector: ContextVar[Optional[ScriptCollector]] = ContextVar(
+    "bootlets_script_collector", default=None
+)
+
+
+@contextmanager
+def collect_scripts() -> Iterator[List[str]]:
+    """Collect the scripts of every Boot drawn inside the block."""
+    collector = ScriptCollector()
+    token = script_collector.set(collector)
+    try:
+        yield collector.scripts
+    finally:
+        script_collector.reset(token)
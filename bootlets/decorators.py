@@ -1,9 +1,10 @@
 from .funcs import try_draw
+from .whitespace import join_children
 
 
 def join_content_with(chr):
     def get_content(self) -> str:
-        return chr.join([try_draw(arg) for arg in self.args])
+        return join_children([try_draw(arg) for arg in self.args], chr)
 
     return get_content
 
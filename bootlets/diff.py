@@ -0,0 +1,202 @@
+import re
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from .boots_base import Boot
+from .funcs import try_draw
+from .html import Fragment
+from .html_base import Base
+
+_ELEMENT_BLOCK = "<{tag}{kwargs}>{content}</{tag}>"
+
+_PLAIN = frozenset([str, int, float, bool])
+
+_plain_id = re.compile(r"-?[A-Za-z_][\w-]*").fullmatch
+
+
+class Patch(NamedTuple):
+    """Replace the element matching ``selector`` (or with ``swap="innerHTML"``
+    its content) with ``html``."""
+
+    selector: str
+    html: str
+    swap: str = "outerHTML"
+
+
+def diff(old: Any, new: Any, target: str = ":root") -> List[Patch]:
+    """The patches which turn the page drawn from ``old`` into that drawn from
+    ``new``, drawing only the parts of ``new`` which changed.
+
+    Nodes are told apart by their ``_key`` or ``id`` where they have one and by
+    their position otherwise. A patch selects an element by its id, or by its
+    path from the nearest element with an id, or from ``target``: the element
+    drawn from ``old``, or the element it was drawn into if ``old`` is not a
+    single element (e.g. a Container). Like the build cache, this assumes a
+    Boot draws the same for the same args and kwargs.
+    """
+    if old is new:
+        return []
+    old_node, new_node = _resolve(old), _resolve(new)
+    patches = []
+    if _is_element(old_node):
+        selector = _selector(old_node, target)
+        if not (
+            _is_element(new_node)
+            and _key(old) == _key(new)
+            and _diff_element(old_node, new_node, selector, patches)
+        ):
+            patches.append(Patch(selector, try_draw(new)))
+    elif _is_element(new_node) or not _diff_children((old,), (new,), target, patches):
+        patches.append(Patch(target, try_draw(new), "innerHTML"))
+    return patches
+
+
+def _resolve(obj: Any) -> Any:
+    while isinstance(obj, Boot):
+        obj = obj._build()
+    return obj
+
+
+def _key(obj: Any) -> Any:
+    if isinstance(obj, Base):
+        kwargs = obj._kwargs
+    elif isinstance(obj, Boot):
+        kwargs = obj.kwargs
+    else:
+        return None
+    return kwargs.get("_key", kwargs.get("id"))
+
+
+def _same(a: Any, b: Any) -> bool:
+    """Whether ``a`` and ``b`` draw the same, without drawing them."""
+    if a is b:
+        return True
+    cls = type(a)
+    if cls is not type(b):
+        return False
+    if cls in _PLAIN:
+        return a == b
+    if isinstance(a, Base):
+        return (
+            a._overrides == b._overrides
+            and _same(a._kwargs, b._kwargs)
+            and _same(a.args, b.args)
+        )
+    if isinstance(a, Boot):
+        return _same(a.kwargs, b.kwargs) and _same(a.args, b.args)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(map(_same, a, b))
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(_same(v, b[k]) for k, v in a.items())
+    try:
+        return bool(a == b)
+    except Exception:  # e.g. NumPy arrays
+        return False
+
+
+def _is_element(node: Any) -> bool:
+    return (
+        isinstance(node, Base)
+        and not node._overrides
+        and node._resolved_block.startswith("<{")
+    )
+
+
+def _is_open(node: Base) -> bool:
+    """Whether the children of ``node`` are drawn, in order, as its content."""
+    cls = type(node)
+    return (
+        cls._resolved_block == _ELEMENT_BLOCK
+        and cls.map_ is Base.map_
+        and cls.get_content is Base.get_content
+    )
+
+
+def _is_transparent(node: Any) -> bool:
+    return isinstance(node, Fragment) and not node._overrides
+
+
+def _is_text(node: Any) -> bool:
+    """Whether ``node`` draws no elements, so that its siblings' positions
+    are known."""
+    if isinstance(node, str):
+        return "<" not in node
+    if isinstance(node, Base):
+        return not node._overrides and node._resolved_block.startswith("<!")
+    return node is None or isinstance(node, (int, float))
+
+
+def _children(args: Iterable[Any]) -> Optional[List[Tuple[Any, Any]]]:
+    """The (arg, node) pairs drawn as children, with fragments flattened, or
+    None if the position of the elements among them is not known."""
+    children = []
+    for arg in args:
+        node = _resolve(arg)
+        if _is_transparent(node):
+            flattened = _children(node.args)
+            if flattened is None:
+                return None
+            children.extend(flattened)
+        elif _is_element(node) or _is_text(node):
+            children.append((arg, node))
+        else:
+            return None
+    return children
+
+
+def _selector(node: Base, path: str) -> str:
+    id_ = node.kwargs.get("id")
+    if not id_ or not isinstance(id_, str):
+        return path
+    if _plain_id(id_):
+        return f"#{id_}"
+    return '[id="{}"]'.format(id_.replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def _diff_element(old: Base, new: Base, selector: str, patches: List[Patch]) -> bool:
+    """Add the patches for the content of ``old``, or return False if the whole
+    element has to be replaced."""
+    if old is new:
+        return True
+    if type(old) is not type(new) or not (_is_open(old) and _is_open(new)):
+        return _same(old, new)
+    if not _same(old._kwargs, new._kwargs):
+        return False
+    return _diff_children(old.args, new.args, selector, patches)
+
+
+def _diff_children(
+    old_args: Iterable[Any], new_args: Iterable[Any], parent: str, patches: List[Patch]
+) -> bool:
+    old_children, new_children = _children(old_args), _children(new_args)
+    if old_children is None or new_children is None:
+        return False
+    if len(old_children) != len(new_children):
+        return False
+
+    changed = []
+    position = 0
+    for (old_arg, old_node), (new_arg, new_node) in zip(old_children, new_children):
+        is_element = _is_element(old_node)
+        if is_element:
+            position += 1
+        if old_arg is new_arg or _same(old_arg, new_arg):
+            continue
+        if is_element != _is_element(new_node):
+            return False
+        if not is_element:
+            if not _same(old_node, new_node):
+                return False  # Text can only be replaced with its parent
+            continue
+        path = f"{parent} > :nth-child({position})"
+        changed.append((old_arg, old_node, new_arg, new_node, path))
+
+    for old_arg, old_node, new_arg, new_node, path in changed:
+        selector = _selector(old_node, path)
+        child_patches = []
+        if _key(old_arg) == _key(new_arg) and _diff_element(
+            old_node, new_node, selector, child_patches
+        ):
+            patches.extend(child_patches)
+        else:
+            patches.append(Patch(selector, try_draw(new_arg)))
+    return True
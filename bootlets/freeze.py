@@ -0,0 +1,166 @@
+import re
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .context import collect_scripts, script_collector
+from .funcs import list_to_str, register_renderer, try_draw
+from .markup import escape_value
+from .options import RenderOptions, get_options
+
+_MISSING = object()
+
+# The defaults of the slots drawn so far while freezing, None otherwise
+_freezing: ContextVar[Optional[Dict[str, Any]]] = ContextVar(
+    "bootlets_freezing", default=None
+)
+
+_marker = re.compile("\x00(content|attr) (\\w+)\x00")
+
+
+def freezing() -> bool:
+    return _freezing.get() is not None
+
+
+class Slot:
+    """A placeholder for a value which is filled in each time a frozen
+    template is rendered. Slots can stand in for anything which is only
+    drawn, such as args, attribute values or the _context of a Boot.
+
+    Drawn outside of freeze(), a slot draws its default. Testing, comparing
+    or hashing a slot while freezing raises TypeError.
+    """
+
+    __slots__ = ("name", "default")
+
+    def __init__(self, name: str, default: Any = _MISSING) -> None:
+        if not name.isidentifier():
+            raise ValueError(f"Slot names must be identifiers: {name!r}")
+        self.name = name
+        self.default = default
+
+    def __repr__(self) -> str:
+        if self.default is _MISSING:
+            return f"Slot({self.name!r})"
+        return f"Slot({self.name!r}, {self.default!r})"
+
+    def __reduce__(self):  # The missing default is a module-level sentinel
+        if self.default is _MISSING:
+            return Slot, (self.name,)
+        return Slot, (self.name, self.default)
+
+    # A slot used in logic rather than drawn, e.g. ``if self.get("_active")``
+    # or ``sizes.get(self.get("_size"))``, would bake the branch taken for
+    # the slot object into the template, so that fails while freezing.
+    def _misused(self, operation: str) -> None:
+        if freezing():
+            raise TypeError(
+                f"{self!r} can only be drawn while freezing, not used in {operation}"
+            )
+
+    def __bool__(self) -> bool:
+        self._misused("a condition")
+        return bool(self._default())
+
+    def __eq__(self, other: Any) -> bool:
+        self._misused("a comparison")
+        return self is other
+
+    def __hash__(self) -> int:
+        self._misused("a lookup")
+        return object.__hash__(self)
+
+    def _marker(self, kind: str) -> Optional[str]:
+        defaults = _freezing.get()
+        if defaults is None:
+            return None
+        if self.default is not _MISSING:
+            defaults.setdefault(self.name, self.default)
+        return f"\x00{kind} {self.name}\x00"
+
+    def _default(self) -> Any:
+        return "" if self.default is _MISSING else self.default
+
+    def draw(self) -> str:
+        marker = self._marker("content")
+        return try_draw(self._default()) if marker is None else marker
+
+    def __str__(self) -> str:
+        marker = self._marker("attr")
+        return str(self._default()) if marker is None else marker
+
+
+register_renderer(Slot, Slot.draw)
+
+
+def _fill_attr(value: Any) -> str:
+    if get_options().autoescape:
+        return escape_value(list_to_str(value))
+    return list_to_str(value)
+
+
+class FrozenTemplate:
+    """The output of a component with every Slot in it left open.
+
+    render() only draws the slot values and joins them with the static
+    segments, which were drawn once by freeze().
+    """
+
+    def __init__(
+        self,
+        literals: List[str],
+        slots: List[Tuple[str, Callable[[Any], str]]],
+        defaults: Dict[str, Any],
+        scripts: List[str],
+        options: RenderOptions,
+    ) -> None:
+        self.literals = literals
+        self.slots = slots
+        self.defaults = defaults
+        self.scripts = scripts
+        self.options = options
+
+    @property
+    def names(self) -> List[str]:
+        return list(dict.fromkeys(name for name, _ in self.slots))
+
+    def render(self, **values: Any) -> str:
+        collector = script_collector.get()
+        if self.scripts and collector is not None:
+            collector.add_drawn(self.scripts)
+        defaults = self.defaults
+        out = [self.literals[0]]
+        for (name, fill), text in zip(self.slots, self.literals[1:]):
+            value = values.get(name, _MISSING)
+            if value is _MISSING:
+                value = defaults.get(name, _MISSING)
+                if value is _MISSING:
+                    raise TypeError(f"render() missing a value for slot {name!r}")
+            out.append(fill(value))
+            out.append(text)
+        return "".join(out)
+
+
+def freeze(obj: Any) -> FrozenTemplate:
+    """Draw ``obj`` once, leaving an opening for every Slot in it, e.g.::
+
+        card = freeze(Card(CardBody(CardTitle(Slot("title")))))
+        card.render(title="Hello")
+
+    The static segments are drawn with the render options in effect when
+    freezing, the slot values with those in effect when rendering.
+    """
+    defaults = {}
+    token = _freezing.set(defaults)
+    try:
+        with collect_scripts() as scripts:
+            content = try_draw(obj)
+    finally:
+        _freezing.reset(token)
+
+    parts = _marker.split(content)
+    literals = parts[::3]
+    slots = [
+        (name, try_draw if kind == "content" else _fill_attr)
+        for kind, name in zip(parts[1::3], parts[2::3])
+    ]
+    return FrozenTemplate(literals, slots, defaults, scripts, get_options())
@@ -1,7 +1,57 @@
-from typing import Any
+import io
+from operator import methodcaller
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from .markup import Markup, escape
+from .options import get_options
+from .whitespace import join_children
+
+Renderer = Callable[[Any], str]
+
+renderers: Dict[type, Renderer] = {}
+_dispatch: Dict[type, Renderer] = {}
+
+
+def register_renderer(type_: type, renderer: Optional[Renderer] = None):
+    """Register the function used by try_draw() to render instances of
+    ``type_`` (and its subclasses). Can also be used as a decorator."""
+
+    def register(renderer: Renderer) -> Renderer:
+        renderers[type_] = renderer
+        _dispatch.clear()
+        return renderer
+
+    if renderer is None:
+        return register
+    return register(renderer)
+
+
+def get_renderer(cls: type) -> Renderer:
+    renderer = _dispatch.get(cls)
+    if renderer is None:
+        for base in cls.__mro__:
+            if base in renderers:
+                renderer = renderers[base]
+                break
+        else:
+            if hasattr(cls, "__html__"):
+                renderer = draw_html
+            elif hasattr(cls, "draw") or hasattr(cls, "_build"):
+                renderer = draw_any
+            else:
+                renderer = draw_text
+        _dispatch[cls] = renderer
+    return renderer
 
 
 def try_draw(obj: Any) -> str:
+    renderer = _dispatch.get(type(obj))
+    if renderer is None:
+        renderer = get_renderer(type(obj))
+    return renderer(obj)
+
+
+def draw_any(obj: Any) -> str:
     try:
         obj = obj._build()
     except AttributeError:
@@ -12,7 +62,124 @@ def try_draw(obj: Any) -> str:
     except (AttributeError, TypeError):
         pass
 
-    return str(obj)
+    return draw_str(str(obj))
+
+
+def draw_str(obj: str) -> str:
+    if get_options().autoescape:
+        return escape(obj)
+    return obj
+
+
+def draw_text(obj: Any) -> str:
+    return draw_str(str(obj))
+
+
+def draw_list(obj) -> str:
+    return join_children([try_draw(item) for item in obj])
+
+
+draw_html = methodcaller("__html__")
+draw_method = methodcaller("draw")
+
+register_renderer(str, draw_str)
+register_renderer(Markup, str.__str__)
+register_renderer(int, str)
+register_renderer(float, str)
+register_renderer(list, draw_list)
+register_renderer(tuple, draw_list)
+
+
+def iter_draw(obj: Any) -> Iterator[str]:
+    if type(obj) is str:
+        yield draw_str(obj)
+        return
+    if isinstance(obj, (list, tuple)):
+        if get_options().whitespace:
+            yield draw_list(obj)
+            return
+        for i, item in enumerate(obj):
+            if i:
+                yield "\n"
+            yield from iter_draw(item)
+        return
+    method = getattr(obj, "iter_draw", None)
+    if method is None:
+        yield try_draw(obj)
+    else:
+        yield from method()
+
+
+Write = Callable[[str], Any]
+
+
+def draw_into(obj: Any, write: Write) -> None:
+    """Pass the output of ``obj`` to ``write`` piece by piece, without
+    joining the output of the children of each node into a string first."""
+    if type(obj) is str:
+        write(draw_str(obj))
+        return
+    if isinstance(obj, (list, tuple)):
+        if get_options().whitespace:
+            write(draw_list(obj))
+            return
+        for i, item in enumerate(obj):
+            if i:
+                write("\n")
+            draw_into(item, write)
+        return
+    method = getattr(obj, "draw_into", None)
+    if method is None:
+        write(try_draw(obj))
+    else:
+        method(write)
+
+
+def get_write(writer: Any) -> Write:
+    if isinstance(writer, list):
+        return writer.append
+    if isinstance(writer, bytearray):
+        return lambda s: writer.extend(s.encode("utf-8"))
+    if isinstance(writer, (io.RawIOBase, io.BufferedIOBase)):
+        return lambda s: writer.write(s.encode("utf-8"))
+    return writer.write
+
+
+def render_into(obj: Any, writer: Any) -> Any:
+    """Draw ``obj`` into ``writer`` and return it. ``writer`` may be a list
+    (of strings), a bytearray or binary file (UTF-8 encoded) or anything
+    with a ``write(str)`` method such as io.StringIO or a text file."""
+    draw_into(obj, get_write(writer))
+    return writer
+
+
+def buffered(chunks: Iterable[str], size: int = 8192) -> Iterator[str]:
+    """Join small chunks together so that each yielded string is at least
+    ``size`` characters long (apart from the last)."""
+    buffer = []
+    length = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield "".join(buffer)
+            buffer = []
+            length = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+attr_names: Dict[str, str] = {}
+
+
+def attr_name(key: str) -> str:
+    """The HTML attribute name for a keyword argument, e.g. class_ -> class,
+    data_toggle -> data-toggle."""
+    name = attr_names.get(key)
+    if name is None:
+        name = "class" if key == "class_" else key.replace("_", "-")
+        attr_names[key] = name
+    return name
 
 
 def list_to_str(obj) -> str:
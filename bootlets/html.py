@@ -1,6 +1,7 @@
 from .decorators import overwrite
 from .funcs import try_draw
 from .html_base import Base
+from .whitespace import join_children
 
 
 ###################################################################################################
@@ -11,6 +12,15 @@ class Comment(Base):
     _block = "<!-- {content} -->"
 
 
+class Fragment(Base):
+    _block = "{content}"
+
+
+@overwrite(get_content=("join_content_with", " "))
+class InlineFragment(Fragment):
+    pass
+
+
 ###################################################################################################
 # A
 
@@ -182,7 +192,7 @@ class DlDict(Dl):
                 # raise NotImplementerError()
                 # TODO: Raise warning or something better
                 continue
-        return "\n".join(items)
+        return join_children(items)
 
 
 ###################################################################################################
@@ -364,7 +374,7 @@ class OlList(Ol):
         for arg in self.args:
             item = self.ItemClass(arg, **self.get("_item_kwargs"))
             items.append(try_draw(item))
-        return "\n".join(items)
+        return join_children(items)
 
 
 class OptGroup(Base):
@@ -567,7 +577,7 @@ class UlList(Ul):
         for arg in self.args:
             item = self.ItemClass(arg, **self.get("_item_kwargs"))
             items.append(try_draw(item))
-        return "\n".join(items)
+        return join_children(items)
 
 
 ###################################################################################################
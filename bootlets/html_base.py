@@ -1,16 +1,58 @@
-import logging
-from inspect import isclass
-from typing import Optional, Any, Type, TypeVar, List, Dict, Callable
+from functools import lru_cache
+from string import Formatter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from .funcs import list_to_str, try_draw
+from .funcs import (
+    Write,
+    attr_name,
+    attr_names,
+    buffered,
+    draw_into,
+    draw_method,
+    iter_draw,
+    list_to_str,
+    register_renderer,
+    render_into,
+    try_draw,
+)
+from .cache import InternCache, fragment_cache, options_key, register_cache
+from .markup import escape_value
+from .options import get_options, render_options
+from .whitespace import (
+    OPTIONAL_END_TAGS,
+    PREFORMATTED,
+    indent_level,
+    indented,
+    join_children,
+    minified_attribute,
+    strip_end_tag,
+)
+
+if TYPE_CHECKING:
+    import logging
 
 BaseType = TypeVar("BaseType", bound="Base")
 
+# The attributes of nodes, drawn once per class, render options and kwargs
+attribute_cache = InternCache()
+register_cache("attributes", attribute_cache.info)
+
 
 class TagDescriptor:
-    def __get__(self, obj, owner):
-        if hasattr(obj, "_tag") and obj._tag:
-            return obj._tag
+    @staticmethod
+    def resolve(owner) -> str:
         if owner._tag:
             return owner._tag
         if len(owner.__mro__) > 3:
@@ -20,11 +62,16 @@ class TagDescriptor:
             return owner.__mro__[-3].__name__.lower()
         return owner.__name__.lower()
 
+    def __get__(self, obj, owner):
+        if obj is not None and obj._overrides and "tag" in obj._overrides:
+            return obj._overrides["tag"]
+        return owner._resolved_tag
+
     def __set__(self, obj, value):
-        obj._tag = value
+        obj._override("tag", value)
 
     def __delete__(self, obj):
-        obj._tag = ""
+        obj._override("tag", "")
 
 
 class BlockDescriptor:
@@ -35,43 +82,117 @@ class BlockDescriptor:
             else "<{tag}{kwargs} {content}>"
         )
 
-    def __get__(self, obj, owner):
-        if obj._block:
-            return obj._block
+    def resolve(self, owner) -> str:
         if owner._block:
             return owner._block
         return self.get_block(owner.closing)
 
-    def __set__(self, value):
-        obj._block = value
+    def __get__(self, obj, owner):
+        if obj is not None and obj._overrides and "block" in obj._overrides:
+            return obj._overrides["block"]
+        return owner._resolved_block
+
+    def __set__(self, obj, value):
+        obj._override("block", value)
 
     def __delete__(self, obj):
-        obj._block = ""
+        obj._override("block", "")
+
+
+class NodeMeta(type):
+    """Gives the Base subclasses of bootlets an empty ``__slots__`` unless
+    they declare their own, so that nodes don't carry a per-instance
+    ``__dict__``. Subclasses defined elsewhere keep theirs unless they
+    declare ``__slots__``."""
+
+    def __new__(mcs, name, bases, namespace, **kwargs):
+        module = namespace.get("__module__", "")
+        if module == "bootlets" or module.startswith("bootlets."):
+            namespace.setdefault("__slots__", ())
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+def _slot_names(cls: type) -> tuple:
+    names = cls.__dict__.get("__slots__", ())
+    return (names,) if isinstance(names, str) else tuple(names)
 
 
-class Base:
+class Base(metaclass=NodeMeta):
+    __slots__ = ("args", "_kwargs", "_attrs", "_overrides")
+
     closing: bool = True
     arg_contracts: Dict[str, Callable] = {}
     defaults: Dict[str, Any] = {}
     skip_kwargs: List[str] = []
     funcs: List[str] = []
+    cache_fragment: bool = False
     _tag: str = ""
     tag = TagDescriptor()
     _block = ""
     block = BlockDescriptor()
 
+    # Resolved once per class by __init_subclass__
+    _resolved_tag: str = "base"
+    _resolved_block: str = BlockDescriptor().get_block()
+    _public_defaults: Dict[str, Any] = {}
+    _skip_kwargs: frozenset = frozenset()
+    _extra_slots: tuple = ()  # Slots declared by subclasses
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._resolved_tag = TagDescriptor.resolve(cls)
+        block = next(
+            k.__dict__["block"] for k in cls.__mro__ if "block" in k.__dict__
+        )
+        if isinstance(block, BlockDescriptor):
+            block = block.resolve(cls)
+        cls._resolved_block = block
+        cls._public_defaults = {
+            k: v for k, v in cls.defaults.items() if not k.startswith("_")
+        }
+        cls._skip_kwargs = frozenset(cls.skip_kwargs)
+        cls._extra_slots = tuple(
+            name
+            for klass in reversed(cls.__mro__[: cls.__mro__.index(Base)])
+            for name in _slot_names(klass)
+            if name not in ("__dict__", "__weakref__")
+        )
+        if cls.__dict__.get("__doc__") is None:
+            cls.__doc__ = cls.__get_doc()
+
     def __init__(
         self, *args: Optional[Type[BaseType]], **kwargs: Optional[Type[BaseType]]
     ) -> None:
-        self.__doc__ = self.__get_doc()
-        self.logger = logging.getLogger(self.__class__.__name__)
-
         self.args = args
         self._kwargs = kwargs
-        self.kwargs = {
-            **{k: v for k, v in self.defaults.items() if not k.startswith("_")},
-            **{k: v for k, v in kwargs.items() if not k.startswith("_")},
-        }
+        self._attrs = None
+        self._overrides = None
+
+    @property
+    def kwargs(self) -> Dict[str, Any]:  # Public defaults merged with kwargs on first use
+        attrs = self._attrs
+        if attrs is None:
+            attrs = self._attrs = {
+                **self._public_defaults,
+                **{k: v for k, v in self._kwargs.items() if not k.startswith("_")},
+            }
+        return attrs
+
+    @kwargs.setter
+    def kwargs(self, value: Dict[str, Any]) -> None:
+        self._attrs = value
+
+    @property
+    def logger(self) -> "logging.Logger":
+        return _logger(self.__class__.__name__)
+
+    def _override(self, key: str, value: str) -> None:
+        overrides = dict(self._overrides or {})
+        if value:
+            overrides[key] = value
+        else:
+            overrides.pop(key, None)
+        self._overrides = overrides or None
 
     def __iter__(self):
         return (arg for arg in self.args)
@@ -87,11 +208,10 @@ class Base:
         s += ")"
         return s
 
-    # TODO: May need to write a wrapper to build and attach __doc__ to specific classes
-    # so that it describes the default parameters
-    def __get_doc(self) -> str:
-        defaults_str = ", ".join(f"{k}={v}" for k, v in self.defaults.items())
-        return f"{self.__class__.__name__}(*args, {defaults_str}, **kwargs)"
+    @classmethod
+    def __get_doc(cls) -> str:
+        defaults_str = ", ".join(f"{k}={v}" for k, v in cls.defaults.items())
+        return f"{cls.__name__}(*args, {defaults_str}, **kwargs)"
 
     def __call__(self, *args, **kwargs):
         args = args if args else self.args
@@ -119,20 +239,431 @@ class Base:
         return map_
 
     def get_content(self) -> str:
-        return "\n".join([try_draw(arg) for arg in self.args])
+        return join_children([try_draw(arg) for arg in self.args])
+
+    def iter_content(self) -> Iterator[str]:
+        if type(self).get_content is not Base.get_content or get_options().whitespace:
+            yield self.get_content()
+            return
+        for i, arg in enumerate(self.args):
+            if i:
+                yield "\n"
+            yield from iter_draw(arg)
 
     def get_kwargs(self) -> str:
-        s = ""
-        if self.kwargs:
-            for key, value in self.kwargs.items():
-                if key in self.skip_kwargs:
-                    continue
-                if key == "class_":
-                    key = "class"
-                value = list_to_str(value)
-                key = key.replace("_", "-")
-                s += f' {key}="{value}"'
-        return s
+        key = options_key(self.kwargs)
+        if key is None:
+            return self._draw_kwargs()
+        key = (self.__class__, get_options(), key)
+        return attribute_cache.get(key, self._draw_kwargs)
+
+    def _draw_kwargs(self) -> str:
+        skip = self._skip_kwargs
+        return draw_attributes(
+            [
+                (attr_names.get(key) or attr_name(key), value)
+                for key, value in self.kwargs.items()
+                if key not in skip
+            ]
+        )
 
     def draw(self) -> str:  # Format the block string using dict generated in map_()
-        return self.block.format(**self.map_())
+        if self._kwargs.get("_cache", self.cache_fragment):
+            return fragment_cache.get_or_draw(self, self._draw)
+        return self._draw()
+
+    def _draw(self) -> str:
+        if self._overrides:
+            return self.block.format(**self.map_())
+        whitespace = get_options().whitespace
+        if whitespace is None:
+            return compile_template(self.__class__)(self)
+        return compile_template(self.__class__, whitespace)(self)
+
+    def iter_draw(self) -> Iterator[str]:  # Yield the output of draw() in chunks
+        if self._overrides or self._kwargs.get("_cache", self.cache_fragment):
+            yield self.draw()
+            return
+        yield from compile_template(self.__class__, get_options().whitespace).iter(self)
+
+    def stream(self, size: int = 8192) -> Iterator[str]:
+        return buffered(self.iter_draw(), size)
+
+    def draw_into(self, write: Write) -> None:
+        if self._overrides or self._kwargs.get("_cache", self.cache_fragment):
+            write(self.draw())
+            return
+        compile_template(self.__class__, get_options().whitespace).write(self, write)
+
+    def draw_content_into(self, write: Write) -> None:
+        if type(self).get_content is not Base.get_content or get_options().whitespace:
+            write(self.get_content())
+            return
+        for i, arg in enumerate(self.args):
+            if i:
+                write("\n")
+            draw_into(arg, write)
+
+    def render_into(self, writer: Any) -> Any:  # Draw straight into a buffer
+        return render_into(self, writer)
+
+    async def adraw(self) -> str:  # Await any awaitable args and children, then draw
+        from .aio import aresolve
+
+        return try_draw(await aresolve(self))
+
+    async def astream(self) -> AsyncIterator[str]:  # Yield chunks as children resolve
+        from .aio import astream
+
+        async for chunk in astream(self):
+            yield chunk
+
+    async def _astream(self) -> AsyncIterator[str]:
+        from .aio import aresolve, astream_children
+
+        block = compile_template(self.__class__, get_options().whitespace)
+        if (
+            self._overrides
+            or self._kwargs.get("_cache", self.cache_fragment)
+            or type(block) is not CompiledBlock
+            or type(self).get_content is not Base.get_content
+            or get_options().whitespace
+            or not _STREAMABLE.issuperset(block.getters)
+        ):
+            yield try_draw(await aresolve(self))
+            return
+        kwargs = await aresolve(self._kwargs)
+        obj = self
+        if kwargs is not self._kwargs:
+            obj = self.__class__(*self.args, **kwargs)
+        if block.literals[0]:
+            yield block.literals[0]
+        for getter, text in zip(block.getters, block.literals[1:]):
+            if getter is _get_content:
+                async for chunk in astream_children(self.args):
+                    yield chunk
+            else:
+                yield getter(obj)
+            if text:
+                yield text
+
+    async def _aresolve(self) -> "Base":
+        from .aio import aresolve_call
+
+        args, kwargs, changed = await aresolve_call(self.args, self._kwargs)
+        if not changed:
+            return self
+        obj = self.__class__(*args, **kwargs)
+        obj._overrides = self._overrides
+        state = self._state()
+        if state is not None:
+            _set_state(obj, state)
+        return obj
+
+    def _fragment_state(self) -> tuple:
+        return self.args, self._kwargs, self._overrides
+
+    def _state(self) -> Any:
+        """The attributes subclasses set on the instance, as the state pickle
+        takes (their dict, or a tuple of it and a dict of slots), or None if
+        there are none."""
+        attrs = getattr(self, "__dict__", None)
+        slots = None
+        if self._extra_slots:
+            slots = {
+                name: getattr(self, name)
+                for name in self._extra_slots
+                if hasattr(self, name)
+            }
+        if slots:
+            return attrs or None, slots
+        return attrs or None
+
+    def __reduce__(self):  # Pickle as (class, args, kwargs), without drawn state
+        args = (self.__class__, self.args, self._kwargs, self._overrides)
+        state = self._state()
+        if state is None:
+            return _restore, args
+        return _restore, args, state
+
+
+def draw_attributes(items: List[Tuple[str, Any]]) -> str:
+    """Draw (name, value) pairs as attributes, as the render options ask."""
+    options = get_options()
+    to_str = _escaped_str if options.autoescape else list_to_str
+    if options.whitespace == "minify":
+        return "".join(
+            [minified_attribute(name, to_str(value)) for name, value in items]
+        )
+    return "".join([f' {name}="{to_str(value)}"' for name, value in items])
+
+
+def _restore(cls, args, kwargs, overrides=None):
+    obj = cls(*args, **kwargs)
+    obj._overrides = overrides
+    return obj
+
+
+def _set_state(obj: Base, state: Any) -> None:
+    attrs, slots = state if isinstance(state, tuple) else (state, {})
+    if attrs:
+        obj.__dict__.update(attrs)
+    for name, value in slots.items():
+        setattr(obj, name, value)
+
+
+@lru_cache(maxsize=None)
+def _logger(name: str) -> "logging.Logger":
+    from logging import getLogger  # Not imported with bootlets.html
+
+    return getLogger(name)
+
+
+def _draw_kwarg(key):
+    def getter(obj):
+        return try_draw(obj.kwargs[key])
+
+    return getter
+
+
+def _draw_func(name):
+    def getter(obj):
+        return try_draw(getattr(obj, name)())
+
+    return getter
+
+
+def _escaped_str(value):
+    return escape_value(list_to_str(value))
+
+
+def _get_content(obj):
+    return obj.get_content()
+
+
+def _get_kwargs(obj):
+    return obj.get_kwargs()
+
+
+register_renderer(Base, draw_method)
+
+# The fields which Base._astream() can draw before the args are resolved
+_STREAMABLE = frozenset([_get_content, _get_kwargs])
+
+
+class CompiledBlock:
+    """A block split into literal segments and the getters filling the fields
+    between them."""
+
+    def __init__(self, literals: List[str], getters: List[Callable]) -> None:
+        self.literals = literals
+        self.getters = getters
+
+    def __call__(self, obj: Base) -> str:
+        out = [self.literals[0]]
+        for getter, text in zip(self.getters, self.literals[1:]):
+            out.append(getter(obj))
+            out.append(text)
+        return "".join(out)
+
+    def iter(self, obj: Base) -> Iterator[str]:
+        if self.literals[0]:
+            yield self.literals[0]
+        for getter, text in zip(self.getters, self.literals[1:]):
+            if getter is _get_content:
+                yield from obj.iter_content()
+            else:
+                yield getter(obj)
+            if text:
+                yield text
+
+    def write(self, obj: Base, write: Write) -> None:
+        if self.literals[0]:
+            write(self.literals[0])
+        for getter, text in zip(self.getters, self.literals[1:]):
+            if getter is _get_content:
+                obj.draw_content_into(write)
+            else:
+                write(getter(obj))
+            if text:
+                write(text)
+
+
+class PrettyBlock(CompiledBlock):
+    """Indents the content of the element by its depth in the tree."""
+
+    def __call__(self, obj: Base) -> str:
+        depth = indent_level.get()
+        out = [self.literals[0]]
+        for getter, text in zip(self.getters, self.literals[1:]):
+            if getter is _get_content:
+                token = indent_level.set(depth + 1)
+                try:
+                    out.append(indented(obj.get_content(), depth))
+                finally:
+                    indent_level.reset(token)
+            else:
+                out.append(getter(obj))
+            out.append(text)
+        return "".join(out)
+
+    def iter(self, obj: Base) -> Iterator[str]:
+        yield self(obj)
+
+    def write(self, obj: Base, write: Write) -> None:
+        write(self(obj))
+
+
+class MinifiedBlock(CompiledBlock):
+    """Leaves out the end tag of the last child where the end of the element
+    makes it optional."""
+
+    def __init__(self, literals: List[str], getters: List[Callable], tag: str) -> None:
+        super().__init__(literals, getters)
+        self.tag = tag
+
+    def __call__(self, obj: Base) -> str:
+        out = [self.literals[0]]
+        for getter, text in zip(self.getters, self.literals[1:]):
+            if getter is _get_content and text:
+                out.append(strip_end_tag(obj.get_content(), self.tag))
+            else:
+                out.append(getter(obj))
+            out.append(text)
+        return "".join(out)
+
+    def iter(self, obj: Base) -> Iterator[str]:
+        if self.literals[0]:
+            yield self.literals[0]
+        for getter, text in zip(self.getters, self.literals[1:]):
+            if getter is _get_content and text:
+                last = ""
+                for chunk in obj.iter_content():
+                    if chunk:
+                        if last:
+                            yield last
+                        last = chunk
+                if last:
+                    yield strip_end_tag(last, self.tag)
+            elif getter is _get_content:
+                yield from obj.iter_content()
+            else:
+                yield getter(obj)
+            if text:
+                yield text
+
+    def write(self, obj: Base, write: Write) -> None:
+        if self.literals[0]:
+            write(self.literals[0])
+        for getter, text in zip(self.getters, self.literals[1:]):
+            if getter is _get_content and text:
+                last = [""]
+
+                def hold(chunk: str) -> None:
+                    if chunk:
+                        if last[0]:
+                            write(last[0])
+                        last[0] = chunk
+
+                obj.draw_content_into(hold)
+                if last[0]:
+                    write(strip_end_tag(last[0], self.tag))
+            elif getter is _get_content:
+                obj.draw_content_into(write)
+            else:
+                write(getter(obj))
+            if text:
+                write(text)
+
+
+class PreformattedBlock:
+    """Draws an element whose whitespace is part of its content as it is
+    drawn without a whitespace option."""
+
+    def __init__(self, cls: Type[Base]) -> None:
+        self.block = compile_template(cls)
+
+    def __call__(self, obj: Base) -> str:
+        token = render_options.set(get_options().replace(whitespace=None))
+        try:
+            return self.block(obj)
+        finally:
+            render_options.reset(token)
+
+    def iter(self, obj: Base) -> Iterator[str]:
+        yield self(obj)
+
+    def write(self, obj: Base, write: Write) -> None:
+        write(self(obj))
+
+
+class GenericBlock:
+    """Fallback for blocks which need the full ``str.format`` machinery."""
+
+    def __call__(self, obj: Base) -> str:
+        return obj.block.format(**obj.map_())
+
+    def iter(self, obj: Base) -> Iterator[str]:
+        yield self(obj)
+
+    def write(self, obj: Base, write: Write) -> None:
+        write(self(obj))
+
+
+_OPTIONAL_END_PARENTS = frozenset(
+    parent for _, parents in OPTIONAL_END_TAGS.values() for parent in parents
+)
+
+
+@lru_cache(maxsize=None)
+def compile_template(
+    cls: Type[Base], whitespace: Optional[str] = None
+) -> Callable[[Base], str]:
+    """Compile the block of ``cls`` into a function equivalent to
+    ``obj.block.format(**obj.map_())``, resolving the block, tag and field
+    lookups once per class rather than on every draw.
+
+    With ``whitespace="minify"`` the end tag of the last child is left out
+    where the element makes it optional, and with ``"pretty"`` the content of
+    an element is indented. Either leaves preformatted elements as they are.
+    """
+    if whitespace is not None and cls._resolved_tag in PREFORMATTED:
+        return PreformattedBlock(cls)
+    if cls.map_ is not Base.map_:
+        return GenericBlock()
+
+    literals = []
+    getters = []
+    literal = ""
+    for text, field, spec, conversion in Formatter().parse(cls._resolved_block):
+        literal += text
+        if field is None:
+            continue
+        if spec or conversion or not field.isidentifier():
+            return GenericBlock()
+        if field == "tag":
+            literal += cls._resolved_tag
+            continue
+        if field == "content":
+            getter = _get_content
+        elif field == "kwargs":
+            getter = _get_kwargs
+        elif field in cls.funcs:
+            getter = _draw_func(field)
+        else:
+            getter = _draw_kwarg(field)
+        literals.append(literal)
+        getters.append(getter)
+        literal = ""
+    literals.append(literal)
+
+    if (
+        literals[-1] == f"</{cls._resolved_tag}>"
+        and getters
+        and getters[-1] is _get_content
+    ):
+        if whitespace == "minify" and cls._resolved_tag in _OPTIONAL_END_PARENTS:
+            return MinifiedBlock(literals, getters, cls._resolved_tag)
+        if whitespace == "pretty":
+            return PrettyBlock(literals, getters)
+    return CompiledBlock(literals, getters)
@@ -1,3 +1,27 @@
+import os
+import re
+from typing import Any, Dict, Optional, Union
+
+from .freeze import FrozenTemplate, freeze
+from .funcs import list_to_str, try_draw
+from .markup import Markup
+from .options import options
+
+try:
+    from jinja2 import (
+        BytecodeCache,
+        ChoiceLoader,
+        DictLoader,
+        Environment,
+        FileSystemBytecodeCache,
+        pass_eval_context,
+    )
+except ImportError:
+    Environment = None
+
+    def pass_eval_context(f):
+        return f
+
 
 class Extend:
     def __init__(self, filename):
@@ -33,7 +57,7 @@ class Something:
         return key.startswith('_')
 
     def _combine_kwargs(self, kwargs1, kwargs2):
-        kwargs = {k:v for k,v in kwargs1.items() if not self._skip_key(key)}
+        kwargs = {k:v for k,v in kwargs1.items() if not self._skip_key(k)}
         for key, value in kwargs2.items():
             if self._skip_key(key):
                 continue
@@ -45,7 +69,7 @@ class Something:
 
     def __call__(self, *args, **kwargs):
         return self.__class__(
-            *args if args else *self.args,
+            *(args if args else self.args),
             **{**self.kwargs, **kwargs}
         )
 
@@ -58,4 +82,83 @@ class Something:
                 s += ', '
             s += ', '.join([f'{k}={v.__repr__()}' for k,v in self._kwargs.items()])
         s += ')'
-        return s
\ No newline at end of file
+        return s
+
+
+###################################################################################################
+# Exporting component trees as Jinja templates
+
+_jinja_syntax = re.compile(r"\{[{%#]|[}%#]\}")
+
+
+def _literal(text: str) -> str:
+    if _jinja_syntax.search(text):
+        return "{% raw %}" + text + "{% endraw %}"
+    return text
+
+
+def to_jinja(obj: Any) -> str:
+    """The source of a Jinja template drawing ``obj``, in which every Slot is
+    a variable of the same name."""
+    return _source(freeze(obj))
+
+
+def _source(template: FrozenTemplate) -> str:
+    out = [_literal(template.literals[0])]
+    for (name, fill), text in zip(template.slots, template.literals[1:]):
+        jinja_filter = "draw" if fill is try_draw else "draw_attr"
+        out.append(f"{{{{ {name}|{jinja_filter} }}}}")
+        out.append(_literal(text))
+    return "".join(out)
+
+
+@pass_eval_context
+def draw_filter(eval_ctx, value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    with options(autoescape=eval_ctx.autoescape):
+        return Markup(try_draw(value))
+
+
+def draw_attr_filter(value: Any) -> str:
+    return list_to_str(value)
+
+
+class JinjaExporter:
+    """Registers component trees as templates of a Jinja Environment.
+
+    The templates are compiled once and, given a ``bytecode_cache`` (or a
+    directory for a FileSystemBytecodeCache), reused across processes; the
+    component tree is then only drawn again to check the source is current.
+    """
+
+    def __init__(
+        self,
+        env: Optional["Environment"] = None,
+        bytecode_cache: Union["BytecodeCache", str, None] = None,
+    ) -> None:
+        if Environment is None:
+            raise RuntimeError("Jinja2 is not installed.")
+        self.sources: Dict[str, str] = {}
+        self.env = env if env is not None else Environment(autoescape=True)
+        loader = DictLoader(self.sources)
+        if self.env.loader is None:
+            self.env.loader = loader
+        else:
+            self.env.loader = ChoiceLoader([self.env.loader, loader])
+        if isinstance(bytecode_cache, str):
+            os.makedirs(bytecode_cache, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache)
+        if bytecode_cache is not None:
+            self.env.bytecode_cache = bytecode_cache
+        self.env.filters["draw"] = draw_filter
+        self.env.filters["draw_attr"] = draw_attr_filter
+
+    def export(self, name: str, obj: Any):
+        """Register ``obj`` as the template ``name`` and return the template.
+        Slot defaults become globals of the template."""
+        frozen = freeze(obj)
+        self.sources[name] = _source(frozen)
+        template = self.env.get_template(name)
+        template.globals.update(frozen.defaults)
+        return template
@@ -0,0 +1,35 @@
+from typing import Any
+
+try:
+    from markupsafe import Markup
+except ImportError:
+
+    class Markup(str):
+        """A string of HTML which is inserted into the output as it is."""
+
+        __slots__ = ()
+
+        def __html__(self) -> "Markup":
+            return self
+
+
+def escape(s: str) -> str:
+    """Escape ``s`` for use in text content and quoted attribute values.
+
+    Chained str.replace() calls return ``s`` itself when there is nothing to
+    replace and, for the short strings typical of components, are faster
+    than both str.translate() and markupsafe.escape().
+    """
+    return (
+        s.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&#34;")
+        .replace("'", "&#39;")
+    )
+
+
+def escape_value(value: Any) -> str:
+    if hasattr(value, "__html__"):
+        return value.__html__()
+    return escape(value)
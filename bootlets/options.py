@@ -0,0 +1,51 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, NamedTuple, Optional
+
+
+WHITESPACE_MODES = (None, "minify", "pretty")
+
+
+class RenderOptions(NamedTuple):
+    autoescape: bool = False
+    # None keeps the newlines between children, "minify" turns them into
+    # spaces where they can be displayed and drops optional end tags and
+    # attribute quotes, "pretty" indents elements
+    whitespace: Optional[str] = None
+
+    def replace(self, **changes) -> "RenderOptions":
+        options = self._replace(**changes)
+        if options.whitespace not in WHITESPACE_MODES:
+            raise ValueError(f"Unknown whitespace mode: {options.whitespace!r}")
+        return options
+
+
+_defaults = [RenderOptions()]
+
+render_options: ContextVar[Optional[RenderOptions]] = ContextVar(
+    "bootlets_render_options", default=None
+)
+
+
+def get_options() -> RenderOptions:
+    options = render_options.get()
+    if options is None:
+        return _defaults[0]
+    return options
+
+
+def set_default_options(**changes) -> RenderOptions:
+    """Change the options used wherever options() is not in effect, e.g.
+    ``set_default_options(autoescape=True)`` once at start up."""
+    _defaults[0] = _defaults[0].replace(**changes)
+    return _defaults[0]
+
+
+@contextmanager
+def options(**changes) -> Iterator[RenderOptions]:
+    """Draw with changed options inside the block."""
+    token = render_options.set(get_options().replace(**changes))
+    try:
+        yield render_options.get()
+    finally:
+        render_options.reset(token)
@@ -0,0 +1,171 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .boots_base import Boot
+from .context import collect_scripts, script_collector
+from .funcs import draw_method, register_renderer, try_draw
+from .options import RenderOptions, get_options, render_options
+from .whitespace import indent_level, join_children
+
+# Set while a worker draws, so that parallel groups nested in its subtree are
+# drawn inline rather than waiting on the pool the worker belongs to.
+in_worker: ContextVar[bool] = ContextVar("bootlets_in_worker", default=False)
+
+
+def tree_size(obj: Any, limit: int) -> int:
+    """Count the nodes and values in ``obj``, stopping once ``limit`` is
+    reached."""
+    count = 0
+    stack = [obj]
+    while stack and count < limit:
+        item = stack.pop()
+        if isinstance(item, (list, tuple)):
+            stack.extend(item)
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.values())
+            continue
+        if item is None:
+            continue
+        count += 1
+        if type(item) is not str and hasattr(item, "_fragment_state"):
+            stack.extend(item._fragment_state())
+    return count
+
+
+def draw_collecting(
+    obj: Any, state: Optional[Tuple[RenderOptions, int]] = None
+) -> Tuple[str, List[str]]:
+    """Draw ``obj``, returning its scripts too. ``state`` passes the render
+    options and indent level of the caller to a process worker."""
+    if state is None:
+        with collect_scripts() as scripts:
+            content = try_draw(obj)
+        return content, scripts
+    options, depth = state
+    options_token = render_options.set(options)
+    depth_token = indent_level.set(depth)
+    try:
+        return draw_collecting(obj)
+    finally:
+        indent_level.reset(depth_token)
+        render_options.reset(options_token)
+
+
+def _work(obj: Any, state: Optional[Tuple[RenderOptions, int]] = None) -> Any:
+    token = in_worker.set(True)
+    try:
+        return draw_collecting(obj, state)
+    finally:
+        in_worker.reset(token)
+
+
+class ParallelRenderer:
+    """Draws independent subtrees on a thread or process pool.
+
+    Use ``executor="thread"`` when build() methods wait on I/O and
+    ``executor="process"`` for CPU-bound trees, which then have to be
+    picklable. Groups of subtrees with fewer than ``threshold`` nodes in
+    total are drawn in the calling thread, except on a thread pool when they
+    include Boots, whose build() may wait on I/O however small the tree.
+    Groups nested in a subtree which is already drawn by a worker are drawn
+    in that worker.
+    """
+
+    def __init__(
+        self,
+        executor: Union[str, Executor] = "thread",
+        max_workers: Optional[int] = None,
+        threshold: int = 500,
+    ) -> None:
+        if isinstance(executor, str) and executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor: {executor!r}")
+        self.executor = executor
+        self.max_workers = max_workers
+        self.threshold = threshold
+        self._pool = None if isinstance(executor, str) else executor
+        self._lock = Lock()
+
+    @property
+    def pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                if self.executor == "process":
+                    self._pool = ProcessPoolExecutor(self.max_workers)
+                else:
+                    self._pool = ThreadPoolExecutor(self.max_workers)
+            return self._pool
+
+    @property
+    def uses_threads(self) -> bool:
+        if isinstance(self.executor, str):
+            return self.executor == "thread"
+        return not isinstance(self.executor, ProcessPoolExecutor)
+
+    def worth_parallel(self, items: Sequence[Any]) -> bool:
+        if len(items) < 2 or in_worker.get():
+            return False
+        if self.uses_threads and any(isinstance(item, Boot) for item in items):
+            return True
+        return tree_size(items, self.threshold) >= self.threshold
+
+    def draw_all(self, items: Sequence[Any]) -> List[str]:
+        if not self.worth_parallel(items):
+            return [try_draw(item) for item in items]
+
+        if self.uses_threads:
+            futures = [
+                self.pool.submit(copy_context().run, _work, item) for item in items
+            ]
+        else:
+            state = (get_options(), indent_level.get())
+            futures = [self.pool.submit(_work, item, state) for item in items]
+
+        results = [future.result() for future in futures]
+        collector = script_collector.get()
+        if collector is not None:
+            for _, scripts in results:
+                collector.add_drawn(scripts)
+        return [content for content, _ in results]
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._pool is not None and isinstance(self.executor, str):
+                self._pool.shutdown(wait=wait)
+                self._pool = None
+
+    def __enter__(self) -> "ParallelRenderer":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+_renderers: Dict[str, ParallelRenderer] = {}
+
+
+def default_renderer(executor: str = "thread") -> ParallelRenderer:
+    """The shared renderer used for ``Container(..., _parallel="thread")``."""
+    renderer = _renderers.get(executor)
+    if renderer is None:
+        renderer = _renderers.setdefault(executor, ParallelRenderer(executor))
+    return renderer
+
+
+class ParallelGroup:
+    """Children which are drawn by a ParallelRenderer and joined with ``sep``."""
+
+    def __init__(
+        self, items: Sequence[Any], renderer: ParallelRenderer, sep: str = "\n"
+    ) -> None:
+        self.items = items
+        self.renderer = renderer
+        self.sep = sep
+
+    def draw(self) -> str:
+        return join_children(self.renderer.draw_all(self.items), self.sep)
+
+
+register_renderer(ParallelGroup, draw_method)
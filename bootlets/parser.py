@@ -0,0 +1,263 @@
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from .decorators import join_content_with
+from .html import Fragment as _Fragment
+from .html_base import Base, BlockDescriptor, draw_attributes
+from .markup import Markup, escape
+from .utils import HTML_MAP
+from .whitespace import OPTIONAL_END_TAGS
+
+VOID_ELEMENTS = frozenset(
+    [
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    ]
+)
+
+# The open elements which a start tag implicitly closes, e.g. <li> another
+# <li>, so that HTML leaving out optional end tags (such as minified output)
+# is nested as it is by browsers. Built from the end tags which the minifier
+# leaves out before a sibling, plus the table cells and rows a new row or
+# section closes.
+IMPLIED_END_TAGS: Dict[str, Set[str]] = {
+    "li": {"p"},
+    "dt": {"p"},
+    "dd": {"p"},
+    "tr": {"td", "th"},
+    "tbody": {"tr", "td", "th"},
+    "tfoot": {"tr", "td", "th"},
+}
+for _tag, (_siblings, _) in OPTIONAL_END_TAGS.items():
+    for _sibling in _siblings:
+        IMPLIED_END_TAGS.setdefault(_sibling, set()).add(_tag)
+
+# Start tags which close an open <p>
+_CLOSE_P = """
+    address article aside blockquote center details dialog dir div dl fieldset
+    figcaption figure footer form h1 h2 h3 h4 h5 h6 header hgroup hr listing main
+    menu nav ol p plaintext pre search section summary table ul xmp
+""".split()
+for _tag in _CLOSE_P:
+    IMPLIED_END_TAGS.setdefault(_tag, set()).add("p")
+
+_SPECIAL = frozenset(
+    """
+    address applet article aside blockquote body button caption center colgroup
+    dd details dir div dl dt fieldset figcaption figure footer form h1 h2 h3 h4
+    h5 h6 head header hgroup html iframe li listing main marquee menu nav noembed
+    noframes noscript object ol p plaintext pre script search section select
+    style summary table tbody td template textarea tfoot th thead title tr ul xmp
+    """.split()
+)
+_SCOPE = frozenset(
+    ["applet", "caption", "html", "marquee", "object", "table", "td", "th", "template"]
+)
+_TABLE_SCOPE = frozenset(["html", "table", "template"])
+_LIST_ITEM_SCOPE = _SPECIAL - {"address", "div", "p"}
+
+# The open elements which stop the search for an implicitly closed element
+# further down, as in the HTML parsing algorithm. Other implicitly closed
+# elements are only closed when they are the current element.
+IMPLIED_END_SCOPES = {
+    "p": _SCOPE | {"button"},
+    "li": _LIST_ITEM_SCOPE,
+    "dt": _LIST_ITEM_SCOPE,
+    "dd": _LIST_ITEM_SCOPE,
+    "tr": _TABLE_SCOPE,
+    "td": _TABLE_SCOPE,
+    "th": _TABLE_SCOPE,
+    "thead": _TABLE_SCOPE,
+    "tbody": _TABLE_SCOPE,
+}
+
+_join_content = join_content_with("")
+
+
+def _element_class(name: str, base: Type[Base], tag: str) -> Type[Base]:
+    """A subclass of ``base`` drawing ``tag`` with only the parsed attributes
+    and content, i.e. without the defaults, extra fields or separators which
+    ``base`` adds."""
+    void = tag in VOID_ELEMENTS
+    namespace = {
+        "__module__": __name__,
+        "__qualname__": name,
+        "_tag": tag,
+        "_block": "<{tag}{kwargs}>" if void else "<{tag}{kwargs}>{content}</{tag}>",
+        "block": BlockDescriptor(),
+        "defaults": {},
+        "funcs": [],
+        "get_content": _join_content,
+    }
+    return type(base)(name, (Parsed, base), namespace)
+
+
+class Parsed:
+    """Draws the kwargs of a parsed node as the attributes they were parsed
+    from, with their names unchanged (e.g. ``data_x`` or ``_x``)."""
+
+    __slots__ = ()
+
+    @property
+    def kwargs(self) -> Dict[str, Any]:
+        return self._kwargs
+
+    def _draw_kwargs(self) -> str:
+        return draw_attributes(list(self._kwargs.items()))
+
+
+class Element(Parsed, Base):
+    """An element whose tag has no class in bootlets.html."""
+
+    get_content = _join_content
+
+
+class Fragment(_Fragment):
+    get_content = _join_content
+
+
+# The class used for each tag, e.g. parser.Div for "div", defined here so
+# that parsed trees can be pickled and serialized.
+element_classes: Dict[str, Type[Base]] = {}
+for _tag, _base in HTML_MAP.items():
+    _name = _tag.upper() if _base.__name__ == "H" else _base.__name__
+    element_classes[_tag] = globals()[_name] = _element_class(_name, _base, _tag)
+del _tag, _base, _name
+
+
+def element(tag: str, attrs: List[Tuple[str, Optional[str]]], children: List) -> Base:
+    kwargs = {
+        name: "" if value is None else Markup(escape(value)) for name, value in attrs
+    }
+    cls = element_classes.get(tag)
+    if cls is not None:
+        return cls(*children, **kwargs)
+    node = Element(*children, **kwargs)
+    node.tag = tag
+    return node
+
+
+class TreeBuilder(HTMLParser):
+    """Builds a bootlets tree from HTML fed to it in chunks. Text, comments and
+    declarations are kept as Markup, as they were written."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self.nodes: List[Any] = []
+        self.open: List[Tuple[str, List, List]] = []  # (tag, attrs, children)
+        self.text: List[str] = []
+
+    def append(self, node: Any) -> None:
+        self.flush()
+        (self.open[-1][2] if self.open else self.nodes).append(node)
+
+    def flush(self) -> None:
+        if self.text:
+            text = Markup("".join(self.text))
+            self.text = []
+            (self.open[-1][2] if self.open else self.nodes).append(text)
+
+    def end(self) -> str:
+        self.flush()
+        tag, attrs, children = self.open.pop()
+        self.append(element(tag, attrs, children))
+        return tag
+
+    def handle_starttag(self, tag: str, attrs: List) -> None:
+        self.flush()
+        closes = IMPLIED_END_TAGS.get(tag)
+        if closes:
+            while self.close_implied(closes):
+                pass
+        if tag in VOID_ELEMENTS:
+            self.append(element(tag, attrs, []))
+        else:
+            self.open.append((tag, attrs, []))
+
+    def close_implied(self, closes: Set[str]) -> bool:
+        """Close the nearest open element in ``closes`` and those opened
+        after it, unless an element scoping it is nearer."""
+        candidates = closes
+        for i in range(len(self.open) - 1, -1, -1):
+            tag = self.open[i][0]
+            if tag in candidates:
+                while len(self.open) > i:
+                    self.end()
+                return True
+            candidates = {
+                closed
+                for closed in candidates
+                if closed in IMPLIED_END_SCOPES
+                and tag not in IMPLIED_END_SCOPES[closed]
+            }
+            if not candidates:
+                return False
+        return False
+
+    def handle_startendtag(self, tag: str, attrs: List) -> None:
+        self.append(element(tag, attrs, []))
+
+    def handle_endtag(self, tag: str) -> None:
+        if any(open_tag == tag for open_tag, _, _ in self.open):
+            while self.end() != tag:
+                pass
+
+    def handle_data(self, data: str) -> None:
+        self.text.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        self.text.append(f"&{name};")
+
+    def handle_charref(self, name: str) -> None:
+        self.text.append(f"&#{name};")
+
+    def handle_comment(self, data: str) -> None:
+        self.append(Markup(f"<!--{data}-->"))
+
+    def handle_decl(self, decl: str) -> None:
+        self.append(Markup(f"<!{decl}>"))
+
+    def handle_pi(self, data: str) -> None:
+        self.append(Markup(f"<?{data}>"))
+
+    def unknown_decl(self, data: str) -> None:
+        self.append(Markup(f"<![{data}]>"))
+
+    def close(self) -> Any:
+        """Close any elements left open and return the tree: the top-level
+        node, or a Fragment of them if there are several."""
+        super().close()
+        self.flush()
+        while self.open:
+            self.end()
+        nodes = [node for node in self.nodes if not _is_space(node)]
+        if len(nodes) == 1:
+            return nodes[0]
+        return Fragment(*self.nodes)
+
+
+def _is_space(node: Any) -> bool:
+    return isinstance(node, str) and not node.strip()
+
+
+def parse(source: Union[str, Iterable[str]]) -> Any:
+    """Parse HTML, a string or an iterable of chunks such as an open file, into
+    a bootlets tree which draws the same HTML."""
+    builder = TreeBuilder()
+    if isinstance(source, str):
+        source = [source]
+    for chunk in source:
+        builder.feed(chunk)
+    return builder.close()
@@ -0,0 +1,307 @@
+import atexit
+import os
+import sys
+import threading
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import IO, Dict, Iterator, List, Optional, Union
+
+from .boots_base import Boot
+from .cache import cache_info
+from .html_base import Base
+
+SORT_KEYS = ("self_time", "total_time", "calls", "chars", "net_blocks", "net_bytes")
+
+# render_into() draws through draw_into(), so is profiled with it.
+PROFILED = ("draw", "iter_draw", "draw_into")
+
+
+class ClassStats:
+    __slots__ = (
+        "name",
+        "calls",
+        "total_time",
+        "self_time",
+        "chars",
+        "net_blocks",
+        "net_bytes",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+        self.chars = 0
+        self.net_blocks = 0
+        self.net_bytes = 0
+
+
+class _Frame:
+    __slots__ = ("name", "obj", "child_time")
+
+    def __init__(self, obj: object) -> None:
+        self.name = obj.__class__.__qualname__
+        self.obj = obj
+        self.child_time = 0.0
+
+
+def _classes_defining(root: type, name: str) -> Iterator[type]:
+    seen = set()
+    stack = [root]
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        if name in cls.__dict__:
+            yield cls
+        stack.extend(cls.__subclasses__())
+
+
+class Profiler:
+    """Records, per component class, how often it was drawn (by draw(),
+    iter_draw(), draw_into() or render_into()), the cumulative and self time
+    spent drawing it and the number of characters it drew.
+
+    ``net_blocks`` is the change in the number of memory blocks allocated by
+    the interpreter (sys.getallocatedblocks()) over each draw and, with
+    ``trace_allocations``, ``net_bytes`` the change in the memory traced by
+    tracemalloc: both are net of anything freed meanwhile and include the
+    allocations of children, like ``total_time``.
+
+    Use as a context manager, or call start() and stop().
+    """
+
+    def __init__(self, trace_allocations: bool = False) -> None:
+        self.trace_allocations = trace_allocations
+        self.stats: Dict[str, ClassStats] = {}
+        self.stacks: Dict[str, float] = defaultdict(float)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._patched: List[tuple] = []
+        self._started_tracemalloc = False
+
+    def start(self) -> "Profiler":
+        if self._patched:
+            return self
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        for root in (Base, Boot):
+            for name in PROFILED:
+                for cls in _classes_defining(root, name):
+                    method = cls.__dict__[name]
+                    self._patched.append((cls, name, method))
+                    setattr(cls, name, self._wrap(name, method))
+        return self
+
+    def stop(self) -> None:
+        for cls, name, method in reversed(self._patched):
+            setattr(cls, name, method)
+        self._patched = []
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _wrap(self, name, method):
+        profiler = self
+
+        if name == "iter_draw":
+
+            def profiled(obj):
+                return profiler._iter_draw(obj, method)
+
+        elif name == "draw_into":
+
+            def profiled(obj, write):
+                return profiler._draw_into(obj, method, write)
+
+        else:
+
+            def profiled(obj):
+                return profiler._draw(obj, method)
+
+        profiled.__wrapped__ = method
+        return profiled
+
+    def _stack(self) -> List[_Frame]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _nested(self, obj) -> bool:
+        # e.g. draw_into() or iter_draw() falling back to the same node's draw()
+        stack = self._stack()
+        return bool(stack) and stack[-1].obj is obj
+
+    def _draw(self, obj, draw) -> str:
+        if self._nested(obj):
+            return draw(obj)
+        frame = _Frame(obj)
+        result = self._run(frame, 1, draw, obj)
+        self._add_chars(frame.name, len(result))
+        return result
+
+    def _draw_into(self, obj, draw_into, write) -> None:
+        if self._nested(obj):
+            return draw_into(obj, write)
+        chars = 0
+
+        def counted(s):
+            nonlocal chars
+            chars += len(s)
+            return write(s)
+
+        frame = _Frame(obj)
+        try:
+            self._run(frame, 1, draw_into, obj, counted)
+        finally:
+            self._add_chars(frame.name, chars)
+
+    def _iter_draw(self, obj, iter_draw) -> Iterator[str]:
+        if self._nested(obj):
+            yield from iter_draw(obj)
+            return
+        frame = _Frame(obj)
+        chunks = self._run(frame, 1, iter_draw, obj)
+        # Only the time spent producing each chunk counts, not the consumer's
+        while True:
+            chunk = self._run(frame, 0, next, chunks, None)
+            if chunk is None:
+                return
+            self._add_chars(frame.name, len(chunk))
+            yield chunk
+
+    def _run(self, frame: _Frame, calls: int, func, *args):
+        stack = self._stack()
+        name = frame.name
+        recursive = any(f.name == name for f in stack)
+        child_time = frame.child_time
+        stack.append(frame)
+
+        tracing = self.trace_allocations and tracemalloc.is_tracing()
+        blocks = sys.getallocatedblocks()
+        memory = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1].child_time += elapsed
+            self_time = elapsed - (frame.child_time - child_time)
+            path = ";".join([f.name for f in stack] + [name])
+            with self._lock:
+                stats = self._stats(name)
+                stats.calls += calls
+                if not recursive:
+                    stats.total_time += elapsed
+                stats.self_time += self_time
+                if tracing:
+                    stats.net_bytes += tracemalloc.get_traced_memory()[0] - memory
+                stats.net_blocks += sys.getallocatedblocks() - blocks
+                self.stacks[path] += self_time
+
+    def _stats(self, name: str) -> ClassStats:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = ClassStats(name)
+        return stats
+
+    def _add_chars(self, name: str, chars: int) -> None:
+        with self._lock:
+            self._stats(name).chars += chars
+
+    def sorted_stats(self, sort: str = "self_time") -> List[ClassStats]:
+        if sort not in SORT_KEYS:
+            raise ValueError(f"sort must be one of {', '.join(SORT_KEYS)}")
+        return sorted(self.stats.values(), key=lambda s: getattr(s, sort), reverse=True)
+
+    def report(self, sort: str = "self_time", limit: Optional[int] = None) -> str:
+        rows = [
+            (
+                s.name,
+                f"{s.calls}",
+                f"{s.total_time * 1000:.3f}",
+                f"{s.self_time * 1000:.3f}",
+                f"{s.chars}",
+                f"{s.net_blocks}",
+                f"{s.net_bytes}" if self.trace_allocations else "-",
+            )
+            for s in self.sorted_stats(sort)[:limit]
+        ]
+        header = (
+            "class",
+            "calls",
+            "total ms",
+            "self ms",
+            "chars",
+            "net blocks",
+            "net B",
+        )
+        widths = [max(len(row[i]) for row in [header, *rows]) for i in range(len(header))]
+        lines = [
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in [header, *rows]
+        ]
+        lines.insert(1, "  ".join("-" * width for width in widths))
+
+        lines += ["", "cache  hits  misses  evictions  size"]
+        for name, info in cache_info().items():
+            lines.append(
+                f"{name}  {info.hits}  {info.misses}  {info.evictions}  {info.currsize}"
+            )
+        return "\n".join(lines)
+
+    def write_collapsed(self, file: Union[str, IO[str]]) -> None:
+        """Write the self time of each stack of classes, in microseconds, in
+        the collapsed format read by flamegraph.pl and speedscope."""
+        lines = [
+            f"{path} {round(seconds * 1_000_000)}\n"
+            for path, seconds in sorted(self.stacks.items())
+        ]
+        if isinstance(file, str):
+            with open(file, "w") as f:
+                f.writelines(lines)
+        else:
+            file.writelines(lines)
+
+
+@contextmanager
+def profile(trace_allocations: bool = False) -> Iterator[Profiler]:
+    profiler = Profiler(trace_allocations)
+    with profiler:
+        yield profiler
+
+
+def profile_from_env(value: Optional[str] = None) -> Profiler:
+    """Profile the whole process, as enabled by the BOOTLETS_PROFILE
+    environment variable. At exit the report is written to stderr and, if
+    the variable is a path rather than "1", the collapsed stacks to it."""
+    value = value if value is not None else os.environ.get("BOOTLETS_PROFILE", "1")
+    profiler = Profiler(
+        trace_allocations=bool(os.environ.get("BOOTLETS_PROFILE_ALLOCATIONS"))
+    ).start()
+
+    def dump():
+        profiler.stop()
+        print(profiler.report(), file=sys.stderr)
+        if value not in ("1", "true", "yes"):
+            profiler.write_collapsed(value)
+
+    atexit.register(dump)
+    return profiler
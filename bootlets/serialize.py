@@ -0,0 +1,169 @@
+import marshal
+import pickle
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Dict, List
+
+from . import _submodules
+from .boots_base import Boot
+from .html_base import Base
+from .markup import Markup
+
+FORMAT_VERSION = 1
+
+# A node is encoded as (class id, kwargs or None, *args), with the class ids
+# indexing the class names stored once per payload. Other tuples start with
+# one of these negative tags.
+_TUPLE = -1
+_MARKUP = -2
+_OBJECT = -3
+_OVERRIDDEN = -4  # (_OVERRIDDEN, class id, kwargs, overrides, *args)
+
+_PLAIN = frozenset([str, int, float, bool, bytes, type(None)])
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a component tree to compact bytes, which loads() turns back
+    into an equal tree in this or another process.
+
+    Values which are neither nodes nor plain data (str, numbers, lists,
+    tuples, dicts and Markup) are pickled, so as with pickle, only load data
+    from a trusted source. Loading finds component classes among those
+    already defined, so import the modules defining your own first.
+    """
+    encoder = _Encoder()
+    tree = encoder.encode(obj)
+    return marshal.dumps((FORMAT_VERSION, encoder.class_names(), tree))
+
+
+def loads(data: bytes) -> Any:
+    version, class_names, tree = marshal.loads(data)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported bootlets serialization format: {version}")
+    return _Decoder([_resolve_class(name) for name in class_names]).decode(tree)
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.classes: Dict[type, int] = {}
+
+    def class_names(self) -> List[str]:
+        return [_class_name(cls) for cls in self.classes]
+
+    def encode(self, obj: Any) -> Any:
+        cls = type(obj)
+        if cls in _PLAIN:
+            return obj
+        if cls is list:
+            return [self.encode(item) for item in obj]
+        if cls is dict and all(type(key) in _PLAIN for key in obj):
+            return {
+                key: value if type(value) in _PLAIN else self.encode(value)
+                for key, value in obj.items()
+            }
+        if isinstance(obj, Base):
+            if obj._state() is not None:  # Attributes set by a subclass
+                return (_OBJECT, pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+            if obj._overrides:
+                return (
+                    _OVERRIDDEN,
+                    self.class_id(cls),
+                    self.encode(obj._kwargs),
+                    obj._overrides,
+                    *[self.encode(arg) for arg in obj.args],
+                )
+            return self.encode_node(cls, obj.args, obj._kwargs)
+        if isinstance(obj, Boot):
+            if obj._state() is not None:  # Attributes set after construction
+                return (_OBJECT, pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+            return self.encode_node(cls, obj.args, obj.kwargs)
+        if cls is tuple:
+            return (_TUPLE, *[self.encode(item) for item in obj])
+        if cls is Markup:
+            return (_MARKUP, str(obj))
+        return (_OBJECT, pickle.dumps(obj, pickle.HIGHEST_PROTOCOL))
+
+    def encode_node(self, cls: type, args: tuple, kwargs: Dict[str, Any]) -> tuple:
+        encode = self.encode
+        return (
+            self.class_id(cls),
+            encode(kwargs) if kwargs else None,
+            *[arg if type(arg) in _PLAIN else encode(arg) for arg in args],
+        )
+
+    def class_id(self, cls: type) -> int:
+        index = self.classes.get(cls)
+        if index is None:
+            index = self.classes[cls] = len(self.classes)
+        return index
+
+
+class _Decoder:
+    def __init__(self, classes: List[type]) -> None:
+        self.classes = classes
+
+    def decode(self, obj: Any) -> Any:
+        cls = type(obj)
+        if cls is tuple:
+            tag = obj[0]
+            if tag >= 0:
+                decode = self.decode
+                kwargs = obj[1]
+                args = [arg if type(arg) in _PLAIN else decode(arg) for arg in obj[2:]]
+                if kwargs is None:
+                    return self.classes[tag](*args)
+                return self.classes[tag](*args, **decode(kwargs))
+            if tag == _TUPLE:
+                return tuple([self.decode(item) for item in obj[1:]])
+            if tag == _MARKUP:
+                return Markup(obj[1])
+            if tag == _OBJECT:
+                return pickle.loads(obj[1])
+            if tag == _OVERRIDDEN:
+                args = [self.decode(arg) for arg in obj[4:]]
+                node = self.classes[obj[1]](*args, **self.decode(obj[2]))
+                node._overrides = obj[3]
+                return node
+            raise ValueError(f"Unknown tag in bootlets serialization: {tag}")
+        if cls is list:
+            return [self.decode(item) for item in obj]
+        if cls is dict:
+            return {
+                key: value if type(value) in _PLAIN else self.decode(value)
+                for key, value in obj.items()
+            }
+        return obj
+
+
+def _class_name(cls: type) -> str:
+    module = cls.__module__
+    if module.startswith("bootlets."):
+        module = module[len("bootlets") :]
+    return f"{module}:{cls.__qualname__}"
+
+
+@lru_cache(maxsize=None)
+def _resolve_class(name: str) -> type:
+    """The component class called ``name``. Only classes which are already
+    defined, or defined in bootlets itself, are found, so that loading never
+    imports a module named by the data."""
+    cls = _component_classes().get(name)
+    if cls is None:
+        module = name.partition(":")[0]
+        if not module.startswith(".") or module[1:] not in _submodules:
+            raise ValueError(f"{name} is not a known component class")
+        import_module(module, __package__)
+        cls = _component_classes().get(name)
+        if cls is None:
+            raise ValueError(f"{name} is not a component class")
+    return cls
+
+
+def _component_classes() -> Dict[str, type]:
+    classes = {}
+    stack = [Base, Boot]
+    while stack:
+        cls = stack.pop()
+        classes[_class_name(cls)] = cls
+        stack.extend(cls.__subclasses__())
+    return classes
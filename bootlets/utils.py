@@ -1,15 +1,29 @@
-from inspect import isclass
-from .base import Base
-from . import templates
+from typing import Dict, Optional, Type
 
+from . import html
+from .html_base import Base
 
-def get_html_tag_map():
+
+def get_html_tag_map() -> Dict[str, Type[Base]]:
+    """Map every tag to the class in bootlets.html drawing it. Where several
+    classes draw the same tag the first one defined wins, e.g. Ol rather than
+    OlList."""
     map_ = {}
-    for t_name in dir(templates):
-        template = getattr(templates, t_name)
-        if isclass(template) and issubclass(template, Base):
-            map_[template.tag] = template
+    for template in vars(html).values():
+        if (
+            isinstance(template, type)
+            and issubclass(template, Base)
+            and template.__module__ == html.__name__
+            and template._resolved_block.startswith("<{tag}")
+        ):
+            map_.setdefault(template._resolved_tag, template)
+    for size in range(1, 7):  # H draws h1-h6 from its _size
+        map_[f"h{size}"] = html.H
     return map_
 
 
 HTML_MAP = get_html_tag_map()
+
+
+def get_tag_class(tag: str) -> Optional[Type[Base]]:
+    return HTML_MAP.get(tag.lower())
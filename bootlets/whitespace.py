@@ -0,0 +1,113 @@
+import re
+from contextvars import ContextVar
+from typing import Dict, FrozenSet, List, Tuple
+
+from .options import get_options
+
+# The elements whose end tag HTML allows to be left out, with the start tags
+# of the siblings it may be left out before and the parents at whose end it
+# may be left out.
+OPTIONAL_END_TAGS: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {
+    tag: (frozenset(siblings), frozenset(parents))
+    for tag, siblings, parents in [
+        ("li", ["li"], ["ul", "ol", "menu"]),
+        ("dt", ["dt", "dd"], []),
+        ("dd", ["dt", "dd"], ["dl"]),
+        ("tr", ["tr"], ["thead", "tbody", "tfoot", "table"]),
+        ("td", ["td", "th"], ["tr"]),
+        ("th", ["td", "th"], ["tr"]),
+        ("option", ["option", "optgroup"], ["select", "datalist", "optgroup"]),
+        ("optgroup", ["optgroup"], ["select"]),
+        ("thead", ["tbody", "tfoot"], []),
+        ("tbody", ["tbody", "tfoot"], ["table"]),
+        ("head", ["body"], []),
+        ("body", [], ["html"]),
+    ]
+}
+
+# Siblings between which whitespace is never displayed
+SPACELESS = frozenset(
+    ["tr", "td", "th", "thead", "tbody", "tfoot", "option", "optgroup", "head", "body"]
+)
+
+# Elements whose whitespace is part of their content, drawn as they are
+# without a whitespace option
+PREFORMATTED = frozenset(["pre", "textarea", "script", "style"])
+
+INDENT = "  "
+
+indent_level: ContextVar[int] = ContextVar("bootlets_indent_level", default=0)
+
+_unquoted_value = re.compile(r"[^\s\"'=<>`]+").fullmatch
+_start_tag = re.compile(r"<([a-z][a-z0-9]*)[\s/>]").match
+_end_tag = re.compile(r"</([a-z][a-z0-9]*)>$").search
+
+
+def join_children(parts: List[str], sep: str = "\n") -> str:
+    """Join drawn children with ``sep``, or as the whitespace option asks
+    when ``sep`` is the default newline."""
+    whitespace = get_options().whitespace
+    if whitespace is None or sep != "\n":
+        return sep.join(parts)
+    if whitespace == "pretty":
+        return ("\n" + INDENT * indent_level.get()).join(parts)
+    return minify_join(parts)
+
+
+def render_state() -> tuple:
+    """The options and, when pretty printing, the indent level which the
+    output of a node depends on."""
+    options = get_options()
+    if options.whitespace == "pretty":
+        return (*options, indent_level.get())
+    return tuple(options)
+
+
+def minify_join(parts: List[str]) -> str:
+    """Join parts with a space, where the newline would have been displayed
+    as one, or with nothing between elements where whitespace is not
+    displayed, leaving out end tags which the next part makes optional."""
+    out = []
+    previous = None
+    for part in parts:
+        if not part:
+            continue
+        if previous is not None:
+            start = _start_tag(part)
+            end = _end_tag(previous)
+            if start and end and {start[1], end[1]} <= SPACELESS:
+                optional = OPTIONAL_END_TAGS.get(end[1])
+                if optional and start[1] in optional[0]:
+                    out[-1] = previous[: end.start()]
+            else:
+                out.append(" ")
+        out.append(part)
+        previous = part
+    return "".join(out)
+
+
+def strip_end_tag(content: str, parent: str) -> str:
+    """Leave out the end tag closing ``content`` if HTML allows it at the end
+    of ``parent``."""
+    end = _end_tag(content)
+    if end:
+        optional = OPTIONAL_END_TAGS.get(end[1])
+        if optional and parent in optional[1]:
+            return content[: end.start()]
+    return content
+
+
+def minified_attribute(name: str, value: str) -> str:
+    if not value:
+        return f" {name}"
+    if _unquoted_value(value):
+        return f" {name}={value}"
+    return f' {name}="{value}"'
+
+
+def indented(content: str, depth: int) -> str:
+    """Put element content on its own lines, unless it is a single line of
+    text."""
+    if content.startswith("<") or "\n" in content:
+        return f"\n{INDENT * (depth + 1)}{content}\n{INDENT * depth}"
+    return content
@@ -156,7 +156,8 @@ setup(
     # projects.
     extras_require={  # Optional
         'dev': ['check-manifest'],
-        'test': ['coverage'],
+        'test': ['coverage', 'hypothesis'],
+        'bench': ['pytest-benchmark'],
     },
 
     # If there are data files included in your packages that need to be
@@ -0,0 +1,195 @@
+import asyncio
+import unittest
+
+from bootlets import boots, html
+from bootlets.aio import adraw, astream
+from bootlets.boots_base import Boot
+from bootlets.cache import BuildCache
+from bootlets.context import collect_scripts
+from bootlets.options import options
+
+
+async def fetch(value, delay=0.05):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def stream_rows(n):
+    for i in range(n):
+        await asyncio.sleep(0)
+        yield [i, i * 2]
+
+
+class Profile(Boot):
+    def build_scripts(self):
+        return html.Script(src="profile.js")
+
+    async def build(self):
+        name = await fetch(self.args[0])
+        return html.Div(html.B(name), fetch(html.I("loaded")))
+
+
+class Counted(Boot):
+    builds = 0
+    build_cache = BuildCache()
+
+    def build_scripts(self):
+        return html.Script(src="counted.js")
+
+    def build(self):
+        Counted.builds += 1
+        return html.Span(*self.args)
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+class TestAsyncDraw(unittest.TestCase):
+    def test_awaits_args(self):
+        obj = html.Div(fetch("a"), html.Span(fetch("b")), id=fetch("x"))
+        self.assertEqual(run(obj.adraw()), '<div id="x">a\n<span>b</span></div>')
+
+    def test_concurrent(self):
+        obj = html.Ul(*[html.Li(fetch(i, delay=0.1)) for i in range(20)])
+        loop = asyncio.new_event_loop()
+        try:
+            start = loop.time()
+            loop.run_until_complete(obj.adraw())
+            self.assertLess(loop.time() - start, 1)
+        finally:
+            loop.close()
+
+    def test_matches_sync(self):
+        obj = boots.Container(
+            boots.Alert(fetch("Heads up"), _context="warning"),
+            boots.ListGroup(fetch("a"), "b"),
+        )
+        expected = boots.Container(
+            boots.Alert("Heads up", _context="warning"), boots.ListGroup("a", "b")
+        ).draw()
+        self.assertEqual(run(obj.adraw()), expected)
+
+    def test_async_build(self):
+        self.assertEqual(
+            run(Profile("ann").adraw()), "<div><b>ann</b>\n<i>loaded</i></div>"
+        )
+        self.assertEqual(run(Profile("ann").abuild()).draw(), run(Profile("ann").adraw()))
+
+    def test_async_generator_rows(self):
+        table = boots.Table(_headers=["a", "b"], _rows=stream_rows(3))
+        expected = boots.Table(_headers=["a", "b"], _rows=[[0, 0], [1, 2], [2, 4]])
+        self.assertEqual(run(table.adraw()), expected.draw())
+        self.assertEqual(run(adraw(html.Ol(stream_rows(1)))), "<ol>0\n0</ol>")
+
+    def test_unchanged_tree_is_reused(self):
+        obj = html.Div(html.B("a"))
+        self.assertEqual(run(obj.adraw()), obj.draw())
+
+    def test_collects_scripts(self):
+        async def main():
+            with collect_scripts() as scripts:
+                await boots.Container(Profile("a")).adraw()
+            return scripts
+
+        self.assertEqual(run(main()), ['<script src="profile.js"></script>'])
+
+    def test_build_cache(self):
+        Counted.builds = 0
+        obj = Counted("a")
+        self.assertEqual(run(obj.adraw()), obj.draw())
+        run(obj.adraw())
+        self.assertEqual(Counted.builds, 1)
+
+    def test_fragment_cache(self):
+        Counted.builds = 0
+
+        async def main():
+            with collect_scripts() as scripts:
+                first = await Counted("b", _cache=True).adraw()
+                second = await Counted("b", _cache=True).adraw()
+            return first, second, scripts
+
+        first, second, scripts = run(main())
+        self.assertEqual(first, second)
+        self.assertEqual(Counted("b", _cache=True).draw(), first)
+        self.assertEqual(Counted.builds, 1)
+        self.assertEqual(scripts, ['<script src="counted.js"></script>'])
+        self.assertEqual(run(Counted("c", _cache=True).abuild()).draw(), "<span>c</span>")
+
+
+class TestStream(unittest.TestCase):
+    def test_matches_draw(self):
+        trees = [
+            lambda: boots.Container(
+                boots.Alert(fetch("Heads up"), _context="warning"),
+                boots.ListGroup(fetch("a"), "b"),
+                Profile("ann"),
+            ),
+            lambda: html.Ol(stream_rows(2), html.Li(fetch("x"))),
+            lambda: boots.Table(_headers=["a", "b"], _rows=stream_rows(3)),
+        ]
+        for whitespace in (None, "minify", "pretty"):
+            for tree in trees:
+                with self.subTest(whitespace=whitespace):
+                    with options(whitespace=whitespace):
+                        chunks = run(collect(astream(tree())))
+                        expected = run(adraw(tree()))
+                    self.assertEqual("".join(chunks), expected)
+
+    def test_children_stream_as_they_resolve(self):
+        async def main():
+            start = asyncio.get_running_loop().time()
+            obj = html.Div(fetch("a", 0), html.P(fetch("b", 0.3)))
+            async for chunk in obj.astream():
+                if chunk == "a":
+                    return asyncio.get_running_loop().time() - start
+
+        self.assertLess(run(main()), 0.2)
+
+    def test_rows_stream_as_they_arrive(self):
+        async def main():
+            shown = asyncio.Event()
+
+            async def rows():
+                yield [1]
+                await asyncio.wait_for(shown.wait(), 1)  # Row 1 was drawn
+                yield [2]
+
+            chunks = []
+            async for chunk in boots.Table(_rows=rows()).astream():
+                chunks.append(chunk)
+                if "<td>1</td>" in chunk:
+                    shown.set()
+            return "".join(chunks)
+
+        self.assertIn("<td>2</td>", run(main()))
+
+    def test_concurrent(self):
+        obj = html.Ul(*[html.Li(fetch(i, delay=0.1)) for i in range(20)])
+        loop = asyncio.new_event_loop()
+        try:
+            start = loop.time()
+            loop.run_until_complete(collect(astream(obj)))
+            self.assertLess(loop.time() - start, 1)
+        finally:
+            loop.close()
+
+    def test_scripts_in_order(self):
+        class Slow(Profile):
+            def build_scripts(self):
+                return html.Script(src="slow.js")
+
+        async def main():
+            with collect_scripts() as scripts:
+                await collect(astream(boots.Container(Slow("a"), Counted("b"))))
+            return scripts
+
+        self.assertEqual(
+            run(main()),
+            ['<script src="slow.js"></script>', '<script src="counted.js"></script>'],
+        )
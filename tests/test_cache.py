@@ -0,0 +1,254 @@
+import gc
+import threading
+import unittest
+
+from bootlets import boots, html
+from bootlets.boots_base import Boot
+from bootlets.cache import (
+    BuildCache,
+    InternCache,
+    LRUBackend,
+    RedisBackend,
+    SharedDictBackend,
+    Uncacheable,
+    cache_info,
+    fragment_key,
+    options_key,
+    set_fragment_backend,
+)
+from bootlets.freeze import Slot
+from bootlets.markup import Markup
+from bootlets.options import options
+
+
+class Counted(Boot):
+    builds = 0
+
+    def build(self):
+        Counted.builds += 1
+        return super().build()
+
+
+class Nested(Counted):
+    def build(self):
+        return Counted(*self.args)
+
+
+class TestBuildCache(unittest.TestCase):
+    def setUp(self):
+        Counted.builds = 0
+        Counted.build_cache = BuildCache()
+
+    def test_memoizes_per_instance(self):
+        obj = Counted("a")
+        self.assertEqual(obj.draw(), obj.draw())
+        self.assertEqual(Counted.builds, 1)
+        Counted("a").draw()
+        self.assertEqual(Counted.builds, 2)
+        self.assertEqual(Counted.build_cache.info().hits, 1)
+
+    def test_does_not_keep_instances_alive(self):
+        for _ in range(10):
+            Counted("a").draw()
+        gc.collect()
+        self.assertEqual(len(Counted.build_cache), 0)
+
+    def test_bounded(self):
+        Counted.build_cache = BuildCache(maxsize=2)
+        objs = [Counted(i) for i in range(5)]
+        for obj in objs:
+            obj.draw()
+        info = Counted.build_cache.info()
+        self.assertEqual((info.currsize, info.evictions), (2, 3))
+        objs[0].draw()
+        self.assertEqual(Counted.builds, 6)
+
+    def test_evicting_nested_boots(self):
+        # Evicting the tree of ``outer`` frees the cached Boot built in it,
+        # which must not wait for the lock held while evicting.
+        Counted.build_cache = BuildCache(maxsize=2)
+
+        def draw():
+            outer = Nested("a")
+            outer.draw()
+            objs = [Counted(i) for i in range(3)]
+            for obj in objs:
+                obj.draw()
+
+        thread = threading.Thread(target=draw, daemon=True)
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(Counted.build_cache.info().evictions, 2)
+
+    def test_disabled(self):
+        Counted.build_cache = BuildCache(maxsize=0)
+        obj = Counted("a")
+        obj.draw()
+        obj.draw()
+        self.assertEqual(Counted.builds, 2)
+        self.assertEqual(len(Counted.build_cache), 0)
+
+    def test_default_cache_is_bounded(self):
+        self.assertIsNotNone(boots.Container.build_cache.maxsize)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value.encode("utf-8")
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+class Nav(Boot):
+    cache_fragment = True
+    builds = 0
+
+    def build(self):
+        Nav.builds += 1
+        return boots.ListGroup(*self.args)
+
+
+class TestFragmentCache(unittest.TestCase):
+    def setUp(self):
+        Nav.builds = 0
+        self.backend = LRUBackend()
+        set_fragment_backend(self.backend)
+
+    def tearDown(self):
+        set_fragment_backend(LRUBackend())
+
+    def test_key(self):
+        self.assertEqual(
+            fragment_key(html.Div(html.B("a"), id="x")),
+            fragment_key(html.Div(html.B("a"), id="x")),
+        )
+        self.assertNotEqual(
+            fragment_key(html.Div(html.B("a"))), fragment_key(html.Div(html.I("a")))
+        )
+        self.assertNotEqual(fragment_key(html.Div(1)), fragment_key(html.Div("1")))
+        with self.assertRaises(Uncacheable):
+            fragment_key(html.Div(object()))
+
+    def test_class_attribute(self):
+        first = Nav("a", "b").draw()
+        self.assertEqual(Nav("a", "b").draw(), first)
+        self.assertEqual(Nav.builds, 1)
+        Nav("a", "c").draw()
+        self.assertEqual(Nav.builds, 2)
+
+    def test_kwarg(self):
+        obj = html.Div("a", _cache=True)
+        self.assertEqual(obj.draw(), "<div>a</div>")
+        self.assertEqual(len(self.backend), 1)
+        html.Div("a").draw()
+        self.assertEqual(len(self.backend), 1)
+        self.assertEqual(boots.Badge("1", _cache=True).draw(), boots.Badge("1").draw())
+        self.assertEqual("".join(html.Div("a", _cache=True).iter_draw()), "<div>a</div>")
+
+    def test_uncacheable_still_draws(self):
+        self.assertEqual(Nav(object).draw(), Nav(object).draw())
+        self.assertEqual(Nav.builds, 2)
+
+    def test_lru_backend_eviction(self):
+        backend = LRUBackend(maxsize=2)
+        for key in "abc":
+            backend.set(key, (key, ()))
+        self.assertIsNone(backend.get("a"))
+        self.assertEqual(backend.evictions, 1)
+
+        backend = LRUBackend(maxsize=None, max_bytes=5)
+        backend.set("a", ("123", ()))
+        backend.set("b", ("45", ("6",)))
+        self.assertIsNone(backend.get("a"))
+        self.assertEqual((backend.get("b"), backend.size), (("45", ("6",)), 3))
+
+    def test_lru_backend_ttl(self):
+        backend = LRUBackend(ttl=-1)
+        backend.set("a", ("1", ()))
+        self.assertIsNone(backend.get("a"))
+
+    def test_shared_dict_backend(self):
+        backend = SharedDictBackend({}, maxsize=2)
+        for key in "abc":
+            backend.set(key, (key, ()))
+        self.assertEqual(len(backend), 2)
+        self.assertEqual(backend.get("c"), ("c", ()))
+        self.assertIsNone(SharedDictBackend({"a": (0, 0, "x")}).get("a"))
+
+    def test_shared_dict_backend_evicts_oldest_in_batches(self):
+        mapping = {}
+        backend = SharedDictBackend(mapping, maxsize=10)
+        for i in range(10):
+            mapping[str(i)] = (None, i, (str(i), ()))
+        backend.get("0")
+        backend.set("10", ("10", ()))
+        self.assertEqual(sorted(mapping, key=int), [str(i) for i in range(2, 11)])
+
+    def test_redis_backend(self):
+        client = FakeRedis()
+        set_fragment_backend(RedisBackend(client))
+        first = Nav("a").draw()
+        self.assertEqual(Nav("a").draw(), first)
+        self.assertEqual(Nav.builds, 1)
+        self.assertEqual(len(client.data), 1)
+
+
+class TestInternCache(unittest.TestCase):
+    def test_counts(self):
+        cache = InternCache(maxsize=2)
+        value = cache.get("a", lambda: "".join(["x", "y"]))
+        self.assertIs(cache.get("a", lambda: "other"), value)
+        cache.get("b", str)
+        cache.get("c", str)
+        self.assertEqual(cache.info(), (1, 3, 1, 2, 2))
+
+    def test_options_key(self):
+        self.assertNotEqual(options_key({"a": 1}), options_key({"a": True}))
+        self.assertNotEqual(options_key({"a": "x"}), options_key({"a": Markup("x")}))
+        self.assertIsNone(options_key({"a": Slot("a")}))
+        self.assertIsNone(options_key({"a": ["b"]}))
+
+    def test_attributes(self):
+        before = cache_info()["attributes"]
+        first = html.Div(class_="row", id="main").draw()
+        self.assertEqual(html.Div(class_="row", id="main").draw(), first)
+        after = cache_info()["attributes"]
+        self.assertGreater(after.hits, before.hits)
+        with options(autoescape=True):
+            self.assertIn('title="&lt;b&gt;"', html.Div(title="<b>").draw())
+            self.assertIn('title="<b>"', html.Div(title=Markup("<b>")).draw())
+        self.assertIn('title="<b>"', html.Div(title="<b>").draw())
+        self.assertIn('hidden="1"', html.Div(hidden=1).draw())
+        self.assertIn('hidden="True"', html.Div(hidden=True).draw())
+
+    def test_classes(self):
+        before = cache_info()["classes"]
+        first = boots.Button("a", _context="danger").draw()
+        second = boots.Button("b", _context="danger").draw()
+        self.assertEqual(second, first.replace(">a<", ">b<"))
+        self.assertIn("btn-danger", first)
+        self.assertGreater(cache_info()["classes"].hits, before.hits)
+        self.assertNotIn("btn-danger", boots.Button("a", _context="info").draw())
+
+    def test_classes_opt_in(self):
+        class Numbered(Boot):
+            def build_classes(self):
+                return f"n-{self.args[0]}"
+
+        class Cached(Numbered):
+            cache_class = True
+
+        self.assertTrue(Boot.cache_class)
+        self.assertFalse(Numbered.cache_class)
+        self.assertIn("n-1", Numbered(1).draw())
+        self.assertIn("n-2", Numbered(2).draw())
+        self.assertIn("n-1", Cached(1).draw())
+        self.assertIn("n-1", Cached(2).draw())
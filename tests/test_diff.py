@@ -0,0 +1,90 @@
+import unittest
+
+from bootlets import boots, html
+from bootlets.diff import Patch, diff
+
+
+def dashboard(count, rows, title="Dashboard"):
+    return html.Div(
+        html.H(title),
+        html.Nav(html.Span("Inbox", boots.Badge(count)), html.Span("Sent")),
+        boots.Table(_rows=rows, _headers=["a", "b"], id="stats"),
+        id="app",
+    )
+
+
+class TestDiff(unittest.TestCase):
+    def test_unchanged(self):
+        self.assertEqual(diff(dashboard(3, [[1, 2]]), dashboard(3, [[1, 2]])), [])
+
+    def test_changed_node(self):
+        patches = diff(dashboard(3, [[1, 2]]), dashboard(4, [[1, 2]]))
+        self.assertEqual(
+            patches,
+            [
+                Patch(
+                    "#app > :nth-child(2) > :nth-child(1) > :nth-child(1)",
+                    boots.Badge(4).draw(),
+                )
+            ],
+        )
+
+    def test_selector_from_id(self):
+        patches = diff(dashboard(3, [[1, 2]]), dashboard(3, [[1, 3]]))
+        tbody = "<tbody><tr><td>1</td>\n<td>3</td></tr></tbody>"
+        self.assertEqual(patches, [Patch("#stats > :nth-child(2)", tbody)])
+
+    def test_text_replaces_parent(self):
+        old = html.Div(html.P("a", html.B("b")), id="x")
+        new = html.Div(html.P("c", html.B("b")), id="x")
+        self.assertEqual(
+            diff(old, new), [Patch("#x > :nth-child(1)", "<p>c\n<b>b</b></p>")]
+        )
+
+    def test_attributes_replace_element(self):
+        old = html.Div(html.P("a", title="1"))
+        new = html.Div(html.P("a", title="2"))
+        self.assertEqual(
+            diff(old, new, "#x"), [Patch("#x > :nth-child(1)", '<p title="2">a</p>')]
+        )
+
+    def test_root(self):
+        self.assertEqual(
+            diff(html.P("a"), html.P("b"), "#x"), [Patch("#x", "<p>b</p>")]
+        )
+        self.assertEqual(
+            diff(html.P("a", id="p"), html.P("b", id="p")),
+            [Patch("#p", '<p id="p">b</p>')],
+        )
+
+    def test_fragment(self):
+        old = boots.Container(html.P("a"), boots.Container(html.P("b")))
+        new = boots.Container(html.P("a"), boots.Container(html.P("c")))
+        self.assertEqual(
+            diff(old, new, "#main"), [Patch("#main > :nth-child(2)", "<p>c</p>")]
+        )
+
+        new = boots.Container(html.P("a"), html.P("b"), html.P("c"))
+        self.assertEqual(
+            diff(old, new, "#main"),
+            [Patch("#main", "<p>a</p>\n<p>b</p>\n<p>c</p>", "innerHTML")],
+        )
+
+    def test_length_replaces_parent(self):
+        old = html.Ul(html.Li("a"), id="list")
+        new = html.Ul(html.Li("a"), html.Li("b"), id="list")
+        self.assertEqual(diff(old, new), [Patch("#list", new.draw())])
+
+    def test_keys(self):
+        def items(key, text):
+            return html.Ul(html.Li("a", _key=1), html.Li(html.B(text), "x", _key=key))
+
+        # A node with a new key is replaced rather than patched
+        self.assertEqual(
+            diff(items(2, "b"), items(3, "c"), "#l"),
+            [Patch("#l > :nth-child(2)", "<li><b>c</b>\nx</li>")],
+        )
+        self.assertEqual(
+            diff(items(2, "b"), items(2, "c"), "#l"),
+            [Patch("#l > :nth-child(2) > :nth-child(1)", "<b>c</b>")],
+        )
@@ -0,0 +1,102 @@
+import unittest
+
+from bootlets import boots
+
+try:
+    import wtforms
+except ImportError:
+    wtforms = None
+
+
+def make_form():
+    class Address(wtforms.Form):
+        city = wtforms.StringField("City")
+        token = wtforms.HiddenField()
+
+    class Profile(wtforms.Form):
+        name = wtforms.StringField("Name")
+        admin = wtforms.BooleanField("Admin")
+        role = wtforms.RadioField("Role", choices=[("a", "A"), ("b", "B")])
+        address = wtforms.FormField(Address)
+        token = wtforms.HiddenField()
+        save = wtforms.SubmitField("Save")
+        cancel = wtforms.SubmitField("Cancel")
+
+    return Profile(data={"name": "x"})
+
+
+class DuckField:
+    """A field drawn like a WTForms field, one class for every field type."""
+
+    def __init__(self, name, type_):
+        self.name = name
+        self.type = type_
+        self.label = lambda **kwargs: f"<label>{name}</label>"
+
+    def __call__(self, class_=""):
+        return f'<input name="{self.name}" class="{class_}">'
+
+
+@unittest.skipIf(wtforms is None, "WTForms is not installed")
+class TestQuickForm(unittest.TestCase):
+    def test_fields(self):
+        form = make_form()
+        out = boots.QuickForm(form, _button_map={"cancel": "secondary"}).draw()
+        expected = "\n".join(
+            [
+                '<form action="" method="POST">'
+                f'<div class="form-group">{form.name.label()}',
+                f'{form.name(class_="form-control")}</div>',
+                '<div class="form-group form-check">'
+                f'{form.admin(class_="form-check-input")}',
+                f'{form.admin.label(class_="form-check-label")}</div>',
+                *[
+                    f'<div class="form-check">{item()}\n{item.label()}</div>'
+                    for item in form.role
+                ],
+                f"<fieldset><legend>{form.address.label()}</legend>",
+                f'<div class="form-group">{form.address.city.label()}',
+                f'{form.address.city(class_="form-control")}</div></fieldset>',
+                f'<div class="form-group">{form.token()}</div>',
+                form.save(class_="btn btn-primary"),
+                f'{form.cancel(class_="btn btn-secondary")}</form>',
+            ]
+        )
+        self.assertEqual(out, expected)
+
+    def test_form_field(self):
+        form = make_form()
+        self.assertEqual(
+            boots.FormField(form.save, _button_map={"save": "success"}).draw(),
+            form.save(class_="btn btn-success"),
+        )
+
+    def test_register_field_builder(self):
+        form = make_form()
+        builders = dict(boots.field_builders)
+        try:
+            boots.register_field_builder("StringField", lambda field, buttons: "s")
+            self.assertEqual(boots.FormField(form.name).draw(), "s")
+        finally:
+            boots.field_builders.clear()
+            boots.field_builders.update(builders)
+            boots._field_dispatch.clear()
+        self.assertIn("form-control", boots.FormField(form.name).draw())
+
+    def test_duck_typed_fields(self):
+        fields = [
+            DuckField("save", "SubmitField"),
+            DuckField("name", "StringField"),
+            DuckField("admin", "BooleanField"),
+        ]
+        self.assertEqual(
+            [boots.FormField(field).draw() for field in fields],
+            [
+                '<input name="save" class="btn btn-primary">',
+                '<div class="form-group"><label>name</label>\n'
+                '<input name="name" class="form-control"></div>',
+                '<div class="form-group form-check">'
+                '<input name="admin" class="form-check-input">\n'
+                "<label>admin</label></div>",
+            ],
+        )
@@ -0,0 +1,85 @@
+import unittest
+
+from bootlets import boots, html
+from bootlets.boots_base import Boot
+from bootlets.context import collect_scripts
+from bootlets.freeze import Slot, freeze
+from bootlets.options import options
+
+
+def card(title, text, id_):
+    return boots.Card(
+        boots.CardBody(boots.CardTitle(title), boots.CardText(text)), id=id_
+    )
+
+
+class TestFreeze(unittest.TestCase):
+    def test_matches_draw(self):
+        template = card(Slot("title"), Slot("text"), Slot("id")).freeze()
+        self.assertEqual(template.names, ["id", "title", "text"])
+        self.assertEqual(
+            template.render(title=html.B("t"), text="x", id="c1"),
+            card(html.B("t"), "x", "c1").draw(),
+        )
+        self.assertEqual(len(template.literals), 4)
+
+    def test_boot_options(self):
+        template = boots.Alert(Slot("message"), _context=Slot("context")).freeze()
+        self.assertEqual(
+            template.render(message="m", context="danger"),
+            boots.Alert("m", _context="danger").draw(),
+        )
+
+    def test_defaults(self):
+        template = freeze(html.P(Slot("a", "default"), Slot("b")))
+        self.assertEqual(template.render(b=1), "<p>default\n1</p>")
+        self.assertEqual(template.render(a="x", b=1), "<p>x\n1</p>")
+        with self.assertRaises(TypeError):
+            template.render(a="x")
+
+    def test_repeated_slot(self):
+        template = freeze(html.Div(html.P(Slot("v")), title=Slot("v")))
+        self.assertEqual(template.render(v="x"), '<div title="x"><p>x</p></div>')
+
+    def test_slot_outside_freeze(self):
+        obj = card(Slot("title", "T"), "text", Slot("id"))
+        obj.freeze()
+        self.assertEqual(obj.draw(), card("T", "text", "").draw())
+
+    def test_slot_in_logic(self):
+        for obj in [
+            boots.BreadcrumbItem("x", _active=Slot("a", False)),
+            boots.Button("b", _size=Slot("s", "lg")),
+        ]:
+            with self.subTest(obj=obj), self.assertRaises(TypeError):
+                freeze(obj)
+        slot = Slot("a", False)
+        self.assertFalse(slot)
+        self.assertEqual({slot: 1}[slot], 1)
+
+    def test_escaping(self):
+        template = freeze(html.A(Slot("text"), href=Slot("href")))
+        with options(autoescape=True):
+            self.assertEqual(
+                template.render(text="<b>", href='"'), '<a href="&#34;">&lt;b&gt;</a>'
+            )
+        self.assertEqual(template.render(text="<b>", href="/"), '<a href="/"><b></a>')
+
+    def test_minified_attribute_stays_quoted(self):
+        with options(whitespace="minify"):
+            template = freeze(html.Div(id=Slot("id")))
+        self.assertEqual(template.render(id="a b"), '<div id="a b"></div>')
+
+    def test_scripts(self):
+        class Widget(Boot):
+            def build_scripts(self):
+                return [html.Script(src="widget.js")]
+
+        template = freeze(Widget(Slot("x")))
+        with collect_scripts() as scripts:
+            template.render(x=1)
+        self.assertEqual(scripts, ['<script src="widget.js"></script>'])
+
+    def test_slot_name(self):
+        with self.assertRaises(ValueError):
+            Slot("not a name")
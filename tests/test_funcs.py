@@ -0,0 +1,58 @@
+import unittest
+
+from bootlets import boots, html
+from bootlets.funcs import (
+    _dispatch,
+    get_renderer,
+    register_renderer,
+    renderers,
+    try_draw,
+)
+
+
+class Money:
+    def __init__(self, amount):
+        self.amount = amount
+
+
+class Safe:
+    def __html__(self):
+        return "<em>safe</em>"
+
+
+class Legacy:
+    def draw(self):
+        return "legacy"
+
+
+class TestTryDraw(unittest.TestCase):
+    def tearDown(self):
+        renderers.pop(Money, None)
+        _dispatch.clear()
+
+    def test_builtin_types(self):
+        self.assertEqual(try_draw("a"), "a")
+        self.assertEqual(try_draw(1), "1")
+        self.assertEqual(try_draw(1.5), "1.5")
+        self.assertEqual(try_draw(None), "None")
+
+    def test_nodes(self):
+        self.assertEqual(try_draw(html.B("x")), "<b>x</b>")
+        self.assertEqual(try_draw(boots.Badge("1")), boots.Badge("1").draw())
+
+    def test_lists(self):
+        self.assertEqual(try_draw(["a", html.I("b"), (1, 2)]), "a\n<i>b</i>\n1\n2")
+
+    def test_html_protocol(self):
+        self.assertEqual(try_draw(Safe()), "<em>safe</em>")
+
+    def test_duck_typed_fallback(self):
+        self.assertEqual(try_draw(Legacy()), "legacy")
+
+    def test_register(self):
+        @register_renderer(Money)
+        def draw_money(obj):
+            return f"${obj.amount:.2f}"
+
+        self.assertIs(get_renderer(Money), draw_money)
+        self.assertEqual(html.Td(Money(3)).draw(), "<td>$3.00</td>")
@@ -0,0 +1,142 @@
+import asyncio
+import pickle
+import unittest
+from inspect import isclass
+
+from bootlets import html
+from bootlets.aio import aresolve
+from bootlets.serialize import dumps, loads
+from bootlets.html_base import Base, compile_template
+
+
+def html_classes():
+    for name in dir(html):
+        template = getattr(html, name)
+        if isclass(template) and issubclass(template, Base):
+            yield template
+
+
+class TestCompiledDraw(unittest.TestCase):
+    cases = [
+        ((), {}),
+        (("a", html.Span("b")), {"class_": ["x", "y"], "data_z": 1}),
+        (({"k": "v"},), {"_size": 3, "_async": True}),
+    ]
+
+    def test_matches_format(self):
+        for template in html_classes():
+            for args, kwargs in self.cases:
+                obj = template(*args, **kwargs)
+                with self.subTest(template=template.__name__, args=args):
+                    self.assertEqual(obj.draw(), obj.block.format(**obj.map_()))
+
+    def test_compiled_once_per_class(self):
+        self.assertIs(compile_template(html.Div), compile_template(html.Div))
+        self.assertIsNot(compile_template(html.Div), compile_template(html.Span))
+
+    def test_instance_overrides(self):
+        obj = html.Div("a")
+        obj.tag = "section"
+        self.assertEqual(obj.draw(), "<section>a</section>")
+        obj.block = "[{content}]"
+        self.assertEqual(obj.draw(), "[a]")
+
+    def test_kwarg_fields(self):
+        class Custom(Base):
+            _block = "<{tag} title={{{title}}}>{content}</{tag}>"
+
+        self.assertEqual(
+            Custom("x", title=html.B("t")).draw(), "<custom title={<b>t</b>}>x</custom>"
+        )
+
+
+class TestClassMetadata(unittest.TestCase):
+    def test_resolved_tag(self):
+        self.assertEqual(html.Div.tag, "div")
+        self.assertEqual(html.DlDict.tag, "dl")
+        self.assertEqual(html.UlList.tag, "ul")
+        self.assertEqual(html.DocType.tag, "DOCTYPE")
+
+        class MyList(html.UlList):
+            pass
+
+        self.assertEqual(MyList.tag, "ul")
+
+    def test_resolved_block(self):
+        self.assertEqual(html.Br.block, "<{tag}{kwargs} {content}>")
+        self.assertEqual(html.H.block, "<{get_tag}{kwargs}>{content}</{get_tag}>")
+        self.assertEqual(html.Comment.block, "<!-- {content} -->")
+
+    def test_public_defaults(self):
+        self.assertEqual(html.Script._public_defaults, {})
+        self.assertEqual(html.A._public_defaults, {"href": "#"})
+        self.assertEqual(html.A(href="/", _x=1).kwargs, {"href": "/"})
+
+    def test_attribute_names(self):
+        self.assertEqual(
+            html.Div(class_="a", data_bs_toggle="b").get_kwargs(),
+            ' class="a" data-bs-toggle="b"',
+        )
+
+
+class Titled(html.Div):
+    def __init__(self, *args, title="", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.title = title
+
+
+class Labelled(html.Div):
+    __slots__ = ("label",)
+
+    def __init__(self, *args, label="", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.label = label
+
+
+async def sleep_value(value):
+    await asyncio.sleep(0)
+    return value
+
+
+class TestCompactNodes(unittest.TestCase):
+    def test_no_instance_dict(self):
+        for template in html_classes():
+            with self.subTest(template=template.__name__):
+                self.assertFalse(hasattr(template(), "__dict__"))
+
+    def test_class_doc(self):
+        self.assertEqual(html.A.__doc__, "A(*args, href=#, **kwargs)")
+
+    def test_lazy_kwargs(self):
+        obj = html.A("x", id="y", _cache=False)
+        self.assertIsNone(obj._attrs)
+        self.assertEqual(obj.kwargs, {"href": "#", "id": "y"})
+        self.assertIs(obj.kwargs, obj.kwargs)
+
+    def test_logger(self):
+        self.assertEqual(html.Div().logger.name, "Div")
+
+    def test_own_slots(self):
+        self.assertEqual(Labelled("a", label="b").label, "b")
+        self.assertFalse(hasattr(Labelled("a"), "__dict__"))
+
+    def test_user_subclass_attributes(self):
+        self.assertTrue(hasattr(Titled("a", title="b"), "__dict__"))
+        self.assertEqual(Titled("a", title="b").title, "b")
+
+    def test_state_kept(self):
+        node = Titled("a", title="b")
+        node.extra = 1
+        for copy in (
+            pickle.loads(pickle.dumps(node)),
+            loads(dumps(node)),
+            asyncio.run(aresolve(Titled(sleep_value("a"), title="b"))),
+        ):
+            with self.subTest(copy=copy):
+                self.assertEqual(copy.title, "b")
+                self.assertEqual(copy.draw(), node.draw())
+        self.assertEqual(pickle.loads(pickle.dumps(node)).extra, 1)
+
+        labelled = Labelled("a", label="b")
+        self.assertEqual(pickle.loads(pickle.dumps(labelled)).label, "b")
+        self.assertEqual(loads(dumps(labelled)).label, "b")
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+import unittest
+
+import bootlets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Budget for the import time of bootlets' own modules, as reported by
+# ``python -X importtime``, relative to that of importing REFERENCE first in
+# the same interpreter, so that it doesn't depend on the machine. Currently
+# about half of this.
+REFERENCE = "argparse"
+IMPORT_BUDGET = {"bootlets.html": 6, "bootlets.boots": 9}
+
+OPTIONAL = ["asyncio", "concurrent.futures", "flask", "jinja2", "json", "wtforms"]
+
+# Modules which each import should leave for first use
+DEFERRED = {
+    "bootlets": OPTIONAL + ["bootlets.html", "hashlib", "logging"],
+    "bootlets.html": OPTIONAL + ["bootlets.boots", "hashlib", "logging"],
+    "bootlets.boots": OPTIONAL + ["hashlib"],
+}
+
+
+def run(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": ROOT},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_times(module):
+    """Import REFERENCE and then ``module`` in a new interpreter, returning
+    the self and cumulative time of each module imported, in microseconds."""
+    result = run("-X", "importtime", "-c", f"import {REFERENCE}; import {module}")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def imported(module, names):
+    """Import ``module`` in a new interpreter, returning those of ``names``
+    which that imported."""
+    code = f"import sys, {module}; print(*[n for n in {names!r} if n in sys.modules])"
+    return run("-c", code).stdout.split()
+
+
+class TestImports(unittest.TestCase):
+    def test_budget(self):
+        for module, budget in IMPORT_BUDGET.items():
+            with self.subTest(module=module):
+                times = import_times(module)
+                own = sum(
+                    t for name, (t, _) in times.items() if name.startswith("bootlets")
+                )
+                self.assertLess(own, budget * times[REFERENCE][1])
+
+    def test_deferred_modules_not_imported(self):
+        for module, names in DEFERRED.items():
+            with self.subTest(module=module):
+                self.assertEqual(imported(module, names), [])
+
+
+class TestLazyAttributes(unittest.TestCase):
+    def test_submodules(self):
+        from bootlets import html
+
+        self.assertIs(bootlets.html, html)
+        self.assertIs(bootlets.Boot, bootlets.boots_base.Boot)
+        self.assertIn("boots", dir(bootlets))
+
+    def test_unknown(self):
+        with self.assertRaises(AttributeError):
+            bootlets.nothing
@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from bootlets import boots, html
+from bootlets.freeze import Slot
+from bootlets.jinja import Extend, JinjaExporter, to_jinja
+
+try:
+    import jinja2
+except ImportError:
+    jinja2 = None
+
+
+class TestToJinja(unittest.TestCase):
+    def test_slots(self):
+        self.assertEqual(
+            to_jinja(html.A(Slot("text"), href=Slot("url"))),
+            '<a href="{{ url|draw_attr }}">{{ text|draw }}</a>',
+        )
+
+    def test_raw_text(self):
+        self.assertEqual(
+            to_jinja(html.P("{{ x }}", Slot("y"))),
+            "{% raw %}<p>{{ x }}\n{% endraw %}{{ y|draw }}</p>",
+        )
+
+    def test_extend(self):
+        self.assertEqual(Extend("base.html").draw(), '{% extends "base.html" %}')
+
+
+@unittest.skipIf(jinja2 is None, "Jinja2 is not installed")
+class TestJinjaExporter(unittest.TestCase):
+    def test_render(self):
+        exporter = JinjaExporter()
+        template = exporter.export(
+            "alert.html", boots.Alert(Slot("message"), _context=Slot("context", "info"))
+        )
+        self.assertEqual(
+            template.render(message="<b>", context="danger"),
+            boots.Alert("&lt;b&gt;", _context="danger").draw(),
+        )
+        self.assertEqual(
+            template.render(message=html.B("x")),
+            boots.Alert(html.B("x"), _context="info").draw(),
+        )
+
+    def test_environment_loader(self):
+        env = jinja2.Environment(
+            loader=jinja2.DictLoader({"page.html": "[{% include 'card.html' %}]"})
+        )
+        exporter = JinjaExporter(env)
+        exporter.export("card.html", boots.Card(Slot("body")))
+        self.assertEqual(
+            env.get_template("page.html").render(body="<b>"),
+            "[" + boots.Card("<b>").draw() + "]",
+        )
+
+    def test_bytecode_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = jinja2.FileSystemBytecodeCache(directory)
+            JinjaExporter(bytecode_cache=cache).export("p.html", html.P(Slot("x")))
+            exporter = JinjaExporter(bytecode_cache=directory)
+            with mock.patch.object(exporter.env, "compile", side_effect=AssertionError):
+                template = exporter.export("p.html", html.P(Slot("x")))
+            self.assertEqual(template.render(x=1), "<p>1</p>")
+
+    def test_bytecode_cache_directory_created(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bootlets-jinja")
+            JinjaExporter(bytecode_cache=path).export("p.html", html.P(Slot("x")))
+            self.assertTrue(os.listdir(path))
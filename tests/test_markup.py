@@ -0,0 +1,98 @@
+import unittest
+
+from bootlets import boots, html
+from bootlets.cache import LRUBackend, fragment_cache, set_fragment_backend
+from bootlets.funcs import iter_draw, try_draw
+from bootlets.markup import Markup, escape
+from bootlets.options import get_options, options
+from bootlets.parallel import ParallelRenderer
+
+try:
+    from markupsafe import Markup as SafeMarkup
+except ImportError:
+    SafeMarkup = Markup
+
+
+class Safe:
+    def __html__(self):
+        return "<i>safe</i>"
+
+
+class Text:
+    def __str__(self):
+        return "<x>"
+
+
+class TestEscape(unittest.TestCase):
+    def test_escape(self):
+        self.assertEqual(
+            escape("<a href=\"x\">'&'</a>"),
+            "&lt;a href=&#34;x&#34;&gt;&#39;&amp;&#39;&lt;/a&gt;",
+        )
+        s = "nothing to escape"
+        self.assertIs(escape(s), s)
+
+    def test_off_by_default(self):
+        self.assertFalse(get_options().autoescape)
+        self.assertEqual(html.P("<b>").draw(), "<p><b></p>")
+
+    def test_options_scope(self):
+        with options(autoescape=True) as opts:
+            self.assertTrue(opts.autoescape)
+        self.assertFalse(get_options().autoescape)
+
+
+class TestAutoescape(unittest.TestCase):
+    def setUp(self):
+        context = options(autoescape=True)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+    def test_content(self):
+        self.assertEqual(html.P("a < b", 1).draw(), "<p>a &lt; b\n1</p>")
+        self.assertEqual("".join(iter_draw(["<", html.B(">")])), "&lt;\n<b>&gt;</b>")
+        self.assertEqual(try_draw(Text()), "&lt;x&gt;")
+
+    def test_attributes(self):
+        self.assertEqual(
+            html.A("x", href='/?a=1&b="2"', class_=["a", "<b>"]).draw(),
+            '<a href="/?a=1&amp;b=&#34;2&#34;" class="a &lt;b&gt;">x</a>',
+        )
+        self.assertEqual(html.A(href=Markup("&amp;")).draw(), '<a href="&amp;"></a>')
+
+    def test_markup_passthrough(self):
+        for value in (Markup("<b>&amp;</b>"), SafeMarkup("<b>&amp;</b>")):
+            with self.subTest(type=type(value)):
+                self.assertEqual(html.P(value).draw(), "<p><b>&amp;</b></p>")
+                self.assertIs(type(try_draw(value)), str)
+        self.assertEqual(html.P(Safe()).draw(), "<p><i>safe</i></p>")
+
+    def test_table_cells(self):
+        table = boots.Table(_headers=["<h>"], _rows=[["<td>"], [SafeMarkup("<b>x</b>")]])
+        out = table.draw()
+        self.assertIn('<th scope="col">&lt;h&gt;</th>', out)
+        self.assertIn("<td>&lt;td&gt;</td>", out)
+        self.assertIn("<td><b>x</b></td>", out)
+
+    def test_boots_entities(self):
+        self.assertIn("&times;", boots.AlertDismissButton().draw())
+        self.assertNotIn("&amp;", boots.AlertDismissButton().draw())
+
+    def test_load(self):
+        content, scripts = boots.Alert("<x>").load()
+        self.assertEqual(content.draw(), boots.Alert("<x>").draw())
+
+    def test_fragment_cache_keyed_on_options(self):
+        set_fragment_backend(LRUBackend())
+        self.addCleanup(set_fragment_backend, LRUBackend())
+        escaped = html.P("<", _cache=True).draw()
+        with options(autoescape=False):
+            raw = html.P("<", _cache=True).draw()
+        self.assertEqual((escaped, raw), ("<p>&lt;</p>", "<p><</p>"))
+        self.assertEqual(len(fragment_cache.backend), 2)
+
+    def test_process_workers(self):
+        with ParallelRenderer("process", max_workers=2, threshold=0) as renderer:
+            self.assertEqual(
+                renderer.draw_all(["<", html.B("&")]), ["&lt;", "<b>&amp;</b>"]
+            )
@@ -0,0 +1,80 @@
+import unittest
+from unittest import mock
+
+from bootlets import boots
+from bootlets.boots import Pagination, window_pages
+
+
+class FakePagination:
+    def __init__(self, page, pages):
+        self.page = page
+        self.pages = pages
+        self.has_prev = page > 1
+        self.has_next = page < pages
+        self.prev_num = page - 1
+        self.next_num = page + 1
+
+    def iter_pages(self, left_edge=2, left_current=2, right_current=5, right_edge=2):
+        last = 0
+        for num in range(1, self.pages + 1):
+            if (
+                num <= left_edge
+                or self.page - left_current - 1 < num < self.page + right_current
+                or num > self.pages - right_edge
+            ):
+                if last + 1 != num:
+                    yield None
+                yield num
+                last = num
+
+
+class FakeRequest:
+    args = {"q": "search"}
+
+
+def fake_url_for(endpoint, **values):
+    query = "&".join(f"{k}={v}" for k, v in values.items())
+    return f"/{endpoint}?{query}"
+
+
+class TestPagination(unittest.TestCase):
+    def setUp(self):
+        self.url_for = mock.Mock(side_effect=fake_url_for)
+        for name, value in (("url_for", self.url_for), ("request", FakeRequest())):
+            patcher = mock.patch.object(boots, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_url_template(self):
+        out = Pagination(FakePagination(5, 20), "items", _fragment="#top").draw()
+        self.assertEqual(self.url_for.call_count, 1)
+        self.assertIn('href="/items?q=search&page=4#top"', out)
+        self.assertIn('href="/items?q=search&page=6#top"', out)
+        self.assertIn('<a href="/items?q=search&page=20" class="page-link">20</a>', out)
+
+    def test_matches_url_for(self):
+        pagination = FakePagination(5, 20)
+        expected = Pagination(pagination, "items").draw()
+        with mock.patch.object(Pagination, "get_url_template", return_value=False):
+            self.assertEqual(Pagination(pagination, "items").draw(), expected)
+
+    def test_fixed_page(self):
+        obj = Pagination(FakePagination(2, 3), "items", _url_kwargs={"page": 1})
+        self.assertFalse(obj.get_url_template())
+        self.assertEqual(obj.get_url(3), "/items?q=search&page=1")
+
+    def test_window(self):
+        pagination = FakePagination(500, 10**9)
+        pagination.iter_pages = mock.Mock(side_effect=AssertionError)
+        out = Pagination(pagination, "items", _window=(1, 1, 2, 1)).draw()
+        self.assertEqual(out.count('class="page-item"'), 6)
+        self.assertIn(">1000000000</a>", out)
+
+    def test_window_pages(self):
+        for pages in range(12):
+            for page in range(1, pages + 1):
+                with self.subTest(page=page, pages=pages):
+                    self.assertEqual(
+                        list(window_pages(page, pages)),
+                        list(FakePagination(page, pages).iter_pages()),
+                    )
@@ -0,0 +1,92 @@
+import pickle
+import threading
+import time
+import unittest
+
+from bootlets import boots, html
+from bootlets.boots_base import Boot
+from bootlets.parallel import ParallelRenderer, tree_size
+
+
+class SlowCard(Boot):
+    def build_scripts(self):
+        return html.Script(src=f"card-{self.args[0]}.js")
+
+    def build(self):
+        time.sleep(0.05)
+        return boots.Card(boots.CardBody(f"card {self.args[0]}"))
+
+
+def dashboard(n=8, **kwargs):
+    return boots.Container(*[SlowCard(i) for i in range(n)], **kwargs)
+
+
+class TestParallel(unittest.TestCase):
+    def test_tree_size(self):
+        self.assertEqual(tree_size(html.Div("a", html.B("b")), 100), 4)
+        self.assertEqual(tree_size([html.Div("a")] * 100, 10), 10)
+
+    def test_threads(self):
+        expected = dashboard().draw()
+        with ParallelRenderer("thread", max_workers=8, threshold=1) as renderer:
+            start = time.perf_counter()
+            self.assertEqual(dashboard(_parallel=renderer).draw(), expected)
+            self.assertLess(time.perf_counter() - start, 0.3)
+
+    def test_processes(self):
+        expected = dashboard(n=3).draw()
+        with ParallelRenderer("process", max_workers=2, threshold=1) as renderer:
+            self.assertEqual(dashboard(n=3, _parallel=renderer).draw(), expected)
+
+    def test_scripts_in_order(self):
+        with ParallelRenderer(threshold=1) as renderer:
+            content, scripts = dashboard(n=4, _parallel=renderer).load()
+        self.assertEqual(
+            scripts.draw(),
+            "\n".join(f'<script src="card-{i}.js"></script>' for i in range(4)),
+        )
+
+    def test_threshold(self):
+        renderer = ParallelRenderer(threshold=10_000)
+        items = [html.P(i) for i in range(10)]
+        self.assertEqual(
+            boots.Container(*items, _parallel=renderer).draw(),
+            boots.Container(*items).draw(),
+        )
+        self.assertIsNone(renderer._pool)
+
+    def test_boots_bypass_threshold(self):
+        expected = dashboard(n=20).draw()
+        start = time.perf_counter()
+        self.assertEqual(dashboard(n=20, _parallel=True).draw(), expected)
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_nested(self):
+        def draw():
+            with ParallelRenderer(max_workers=2, threshold=1) as renderer:
+                inner = [dashboard(n=3, _parallel=renderer) for _ in range(4)]
+                results.append(boots.Container(*inner, _parallel=renderer).draw())
+
+        results = []
+        thread = threading.Thread(target=draw, daemon=True)
+        thread.start()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(
+            results, [boots.Container(*[dashboard(n=3) for _ in range(4)]).draw()]
+        )
+
+    def test_default_renderer(self):
+        items = [html.P(i) for i in range(10)]
+        self.assertEqual(
+            boots.Container(*items, _parallel=True, _inline=True).draw(),
+            boots.Container(*items, _inline=True).draw(),
+        )
+
+    def test_picklable(self):
+        tree = dashboard(n=2)
+        self.assertEqual(pickle.loads(pickle.dumps(tree)).draw(), tree.draw())
+
+    def test_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            ParallelRenderer("fibers")
@@ -0,0 +1,134 @@
+import pickle
+import unittest
+
+from bootlets import boots, html
+from bootlets.html_base import Base
+from bootlets.markup import Markup
+from bootlets.options import options
+from bootlets.parser import parse
+from bootlets.serialize import dumps, loads
+from bootlets.utils import HTML_MAP, get_tag_class
+
+PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>A &amp; B</title></head>
+<body><!-- nav --><div id="main" class="a b">Hello <b>world</b>&nbsp;&#169;
+<h2>Title</h2><button>Go</button><input name="q" disabled><br>
+<my-widget size="1">x</my-widget><script>if (a < b) {}</script></div></body>
+</html>"""
+
+
+class TestTagMap(unittest.TestCase):
+    def test_lookup(self):
+        self.assertIs(HTML_MAP["div"], html.Div)
+        self.assertIs(HTML_MAP["ol"], html.Ol)
+        self.assertIs(HTML_MAP["h3"], html.H)
+        self.assertIs(get_tag_class("TD"), html.Td)
+        self.assertIsNone(get_tag_class("my-widget"))
+        self.assertNotIn("fragment", HTML_MAP)
+
+
+class TestParse(unittest.TestCase):
+    def test_round_trip(self):
+        tree = parse(PAGE)
+        self.assertEqual(tree.draw(), PAGE.replace(" disabled>", ' disabled="">'))
+        with options(autoescape=True):
+            self.assertEqual(parse(PAGE).draw(), tree.draw())
+
+    def test_nodes(self):
+        div = parse('<div id="a">x <b>y</b></div>')
+        self.assertIsInstance(div, html.Div)
+        self.assertEqual(div.kwargs, {"id": "a"})
+        self.assertEqual(div.args[0], Markup("x "))
+        self.assertIsInstance(div.args[1], html.B)
+        self.assertIsInstance(parse("<h2>t</h2>"), html.H)
+
+    def test_no_defaults(self):
+        self.assertEqual(parse("<a>x</a>").draw(), "<a>x</a>")
+        self.assertEqual(parse("<img src='a.png'>").draw(), '<img src="a.png">')
+        self.assertEqual(parse("<dialog></dialog>").draw(), "<dialog></dialog>")
+
+    def test_attributes(self):
+        self.assertEqual(
+            parse("<p title='a \"b\" &amp; c'>x</p>").draw(),
+            '<p title="a &#34;b&#34; &amp; c">x</p>',
+        )
+
+    def test_implied_end_tags(self):
+        self.assertEqual(
+            parse("<ul><li>a<li><b>b</b></ul>").draw(),
+            "<ul><li>a</li><li><b>b</b></li></ul>",
+        )
+        self.assertEqual(
+            parse("<table><tr><td>1<td>2<tr><td>3</table>").draw(),
+            "<table><tr><td>1</td><td>2</td></tr><tr><td>3</td></tr></table>",
+        )
+
+    def test_minified_parses_back(self):
+        def shape(node):
+            if isinstance(node, str):
+                return node.strip()
+            children = [shape(child) for child in node.args]
+            return (node.tag, node.kwargs, [c for c in children if c != ""])
+
+        class Html(Base):
+            pass
+
+        page = Html(
+            html.Head(html.Title("t")),
+            html.Body(
+                html.P("x"),
+                html.Selection(
+                    html.OptGroup(html.Option("1"), html.Option("2"), label="a"),
+                    html.OptGroup(html.Option("3"), label="b"),
+                ),
+            ),
+        )
+        table = boots.Table(_headers=["a", "b"], _rows=[[1, 2], [3, 4]])
+        for tree, omitted in [(page, "</head>"), (table, "</thead>")]:
+            with self.subTest(tree.__class__.__name__):
+                with options(whitespace="minify"):
+                    minified = tree.draw()
+                self.assertNotIn(omitted, minified)
+                self.assertEqual(shape(parse(minified)), shape(parse(tree.draw())))
+
+    def test_implied_paragraph_end(self):
+        self.assertEqual(parse("<p>a<p>b").draw(), "<p>a</p><p>b</p>")
+        self.assertEqual(
+            parse("<div><p>a<b>b</b><ul><li>c</ul></div>").draw(),
+            "<div><p>a<b>b</b></p><ul><li>c</li></ul></div>",
+        )
+        self.assertEqual(
+            parse("<p><button><p>a</button>b").draw(),
+            "<p><button><p>a</p></button>b</p>",
+        )
+        self.assertEqual(
+            parse("<ul><li>a<ul><li>b</ul><li>c</ul>").draw(),
+            "<ul><li>a<ul><li>b</li></ul></li><li>c</li></ul>",
+        )
+
+    def test_attribute_names(self):
+        source = (
+            '<div data_x="1" _y="2" data-z="3"><my-tag a_b="c" _d="">x</my-tag></div>'
+        )
+        tree = parse(source)
+        self.assertEqual(tree.draw(), source)
+        self.assertEqual(tree.kwargs, {"data_x": "1", "_y": "2", "data-z": "3"})
+        self.assertEqual(loads(dumps(tree)).draw(), source)
+        self.assertEqual(pickle.loads(pickle.dumps(tree)).draw(), source)
+
+    def test_unbalanced(self):
+        self.assertEqual(parse("<div><p>a</div></span>").draw(), "<div><p>a</p></div>")
+        self.assertEqual(parse("<div><p>a").draw(), "<div><p>a</p></div>")
+
+    def test_fragment(self):
+        self.assertEqual(parse("<p>a</p>\n<p>b</p>").draw(), "<p>a</p>\n<p>b</p>")
+        self.assertEqual(parse("\n<p>a</p>\n").draw(), "<p>a</p>")
+
+    def test_chunks(self):
+        chunks = [PAGE[i : i + 7] for i in range(0, len(PAGE), 7)]
+        self.assertEqual(parse(chunks).draw(), parse(PAGE).draw())
+
+    def test_serialize(self):
+        tree = parse(PAGE)
+        self.assertEqual(loads(dumps(tree)).draw(), tree.draw())
+        self.assertEqual(pickle.loads(pickle.dumps(tree)).draw(), tree.draw())
@@ -0,0 +1,80 @@
+import io
+import unittest
+
+from bootlets import boots, html
+from bootlets.boots_base import Boot
+from bootlets.html_base import Base
+from bootlets.profiler import Profiler, profile
+
+
+def page():
+    return boots.Container(
+        boots.Alert("a"), html.Div(html.Div(html.Span("x")), html.P("y"))
+    )
+
+
+class TestProfiler(unittest.TestCase):
+    def test_counts(self):
+        with profile() as profiler:
+            page().draw()
+        stats = profiler.stats
+        self.assertEqual(stats["Div"].calls, 3)
+        self.assertEqual(stats["Span"].calls, 1)
+        self.assertEqual(stats["Alert"].calls, 1)
+        self.assertEqual(stats["Span"].chars, len("<span>x</span>"))
+        self.assertLessEqual(stats["Container"].self_time, stats["Container"].total_time)
+        self.assertLessEqual(stats["Div"].total_time, stats["Container"].total_time)
+
+    def test_chars(self):
+        with profile() as profiler:
+            html.P("é").draw()
+        self.assertEqual(profiler.stats["P"].chars, len("<p>é</p>"))
+
+    def test_streaming_and_render_into(self):
+        expected = page().draw()
+        for name, draw in [
+            ("iter_draw", lambda obj: "".join(obj.iter_draw())),
+            ("stream", lambda obj: "".join(obj.stream(4))),
+            ("render_into", lambda obj: obj.render_into(io.StringIO()).getvalue()),
+        ]:
+            with self.subTest(name):
+                with profile() as profiler:
+                    self.assertEqual(draw(page()), expected)
+                stats = profiler.stats
+                self.assertEqual(stats["Div"].calls, 3)
+                self.assertEqual(stats["Span"].calls, 1)
+                self.assertEqual(stats["Container"].calls, 1)
+                self.assertEqual(stats["Container"].chars, len(expected))
+                self.assertEqual(stats["Span"].chars, len("<span>x</span>"))
+                self.assertLessEqual(
+                    stats["Div"].total_time, stats["Container"].total_time
+                )
+
+    def test_restores_draw(self):
+        names = ("draw", "iter_draw", "draw_into")
+        methods = {name: Base.__dict__[name] for name in names}
+        with profile():
+            for name, method in methods.items():
+                self.assertIsNot(Base.__dict__[name], method)
+        for name, method in methods.items():
+            self.assertIs(Base.__dict__[name], method)
+        self.assertIs(Boot.__dict__["draw"].__name__, "draw")
+
+    def test_report(self):
+        with Profiler(trace_allocations=True) as profiler:
+            page().draw()
+        report = profiler.report(sort="calls")
+        lines = report.splitlines()
+        self.assertTrue(lines[0].startswith("class"))
+        self.assertTrue(lines[2].startswith("Div"))
+        self.assertIn("fragment", report)
+        with self.assertRaises(ValueError):
+            profiler.report(sort="name")
+
+    def test_collapsed(self):
+        with profile() as profiler:
+            page().draw()
+        out = io.StringIO()
+        profiler.write_collapsed(out)
+        paths = [line.rsplit(" ", 1)[0] for line in out.getvalue().splitlines()]
+        self.assertIn("Container;Fragment;Div;Div;Span", paths)
@@ -0,0 +1,70 @@
+import unittest
+
+from bootlets import boots, html
+from bootlets.boots_base import Boot, try_get_scripts
+from bootlets.cache import LRUBackend, set_fragment_backend
+
+
+class Chart(Boot):
+    builds = 0
+
+    def build_scripts(self):
+        return [html.Script(src="chart.js"), html.Script(f"draw({self.args[0]!r})")]
+
+    def build(self):
+        Chart.builds += 1
+        return html.Canvas(id=self.args[0])
+
+
+class Widget(Boot):
+    cache_fragment = True
+
+    def build_scripts(self):
+        return html.Script(src="widget.js")
+
+    def build(self):
+        return html.Div(Chart("w"))
+
+
+class TestLoad(unittest.TestCase):
+    def setUp(self):
+        Chart.builds = 0
+        set_fragment_backend(LRUBackend())
+
+    def test_single_pass(self):
+        page = boots.Container(html.Div(Chart("a")), Chart("b"))
+        content, scripts = page.load()
+        self.assertEqual(Chart.builds, 2)
+        self.assertEqual(content.draw(), page.draw())
+        self.assertEqual(
+            scripts.draw(),
+            "\n".join(
+                [
+                    '<script src="chart.js"></script>',
+                    "<script>draw('a')</script>",
+                    "<script>draw('b')</script>",
+                ]
+            ),
+        )
+
+    def test_try_get_scripts(self):
+        self.assertEqual(
+            try_get_scripts([Chart("a"), Chart("a")]),
+            ['<script src="chart.js"></script>', "<script>draw('a')</script>"],
+        )
+
+    def test_cached_fragment_keeps_scripts(self):
+        first = boots.Container(Widget()).load()
+        second = boots.Container(Widget()).load()
+        self.assertEqual(Chart.builds, 1)
+        self.assertEqual(second[0].draw(), first[0].draw())
+        self.assertEqual(second[1].draw(), first[1].draw())
+        self.assertIn("widget.js", second[1].draw())
+        self.assertIn("chart.js", second[1].draw())
+
+    def test_streaming_collects(self):
+        from bootlets.context import collect_scripts
+
+        with collect_scripts() as scripts:
+            "".join(boots.Container(Chart("a")).iter_draw())
+        self.assertEqual(len(scripts), 2)
@@ -0,0 +1,105 @@
+import marshal
+import os
+import pickle
+import sys
+import tempfile
+import unittest
+
+from bootlets import boots, html
+from bootlets.boots_base import Boot
+from bootlets.freeze import Slot, freeze
+from bootlets.markup import Markup
+from bootlets.serialize import FORMAT_VERSION, dumps, loads
+
+
+def page():
+    return boots.Container(
+        boots.Alert("Heads up", html.B(Markup("<i>!</i>")), _context="warning"),
+        boots.Table(_headers=["a", "b"], _rows=[(i, i * 2) for i in range(5)]),
+        boots.DescriptionList({"a": 1, "b": [2.5, None]}),
+        html.Ul(*[html.Li(f"item {i}", class_="item") for i in range(20)]),
+        html.H("title", _size=2),
+        id="page",
+    )
+
+
+class Extra(Boot):
+    def build(self):
+        return html.Div(getattr(self, "extra", "none"))
+
+
+class TestSerialize(unittest.TestCase):
+    def assertRoundTrip(self, obj):
+        copy = loads(dumps(obj))
+        self.assertIsNot(copy, obj)
+        self.assertEqual(copy.draw(), obj.draw())
+        return copy
+
+    def test_round_trip(self):
+        copy = self.assertRoundTrip(page())
+        self.assertEqual(type(copy.args[0].args[1]), html.B)
+        self.assertEqual(type(copy.args[0].args[1].args[0]), Markup)
+        self.assertEqual(copy.args[1].kwargs["_rows"][0], (0, 0))
+
+    def test_overrides(self):
+        node = html.Div("x", id="a")
+        node.tag = "section"
+        copy = self.assertRoundTrip(node)
+        self.assertEqual(copy.draw(), '<section id="a">x</section>')
+
+    def test_other_values(self):
+        obj = html.Div(Slot("a"), Slot("b", "default"))
+        copy = loads(dumps(obj))
+        self.assertEqual(freeze(copy).render(a="x"), "<div>x\ndefault</div>")
+
+    def test_version(self):
+        data = marshal.dumps((FORMAT_VERSION + 1, [], None))
+        with self.assertRaises(ValueError):
+            loads(data)
+
+    def test_only_components(self):
+        names = ["os:system", "this:s", "zhtml:X", ".markup:Markup", ".nonexistent:X"]
+        with tempfile.TemporaryDirectory() as path:
+            # A top-level module named like a bootlets submodule
+            with open(os.path.join(path, "zhtml.py"), "w") as f:
+                f.write("class X: pass\n")
+            sys.path.insert(0, path)
+            try:
+                for name in names:
+                    data = marshal.dumps((FORMAT_VERSION, [name], (0, None)))
+                    with self.subTest(name=name), self.assertRaises(ValueError):
+                        loads(data)
+            finally:
+                sys.path.remove(path)
+        # Nothing named by the data is imported
+        self.assertNotIn("this", sys.modules)
+        self.assertNotIn("zhtml", sys.modules)
+
+    def test_size(self):
+        tree = page()
+        tree.draw()
+        pickled = pickle.dumps(tree, pickle.HIGHEST_PROTOCOL)
+        self.assertLess(len(dumps(tree)), len(pickled))
+
+
+class TestPickle(unittest.TestCase):
+    def test_round_trip(self):
+        tree = page()
+        before = pickle.dumps(tree)
+        self.assertEqual(pickle.loads(before).draw(), tree.draw())
+        # Nothing drawn is kept in the pickle
+        self.assertEqual(pickle.dumps(tree), before)
+
+    def test_boot_state(self):
+        boot = Extra()
+        boot.extra = "set"
+        self.assertEqual(boot.draw(), "<div>set</div>")
+        for copy in (pickle.loads(pickle.dumps(boot)), loads(dumps(boot))):
+            with self.subTest(copy=copy):
+                self.assertEqual(copy.draw(), "<div>set</div>")
+                self.assertIsNot(copy.logger, None)
+        self.assertEqual(pickle.loads(pickle.dumps(Extra())).draw(), "<div>none</div>")
+
+    def test_slot(self):
+        slot = pickle.loads(pickle.dumps(Slot("a")))
+        self.assertEqual(html.P(slot).draw(), "<p></p>")
@@ -0,0 +1,76 @@
+import io
+import unittest
+
+from bootlets import boots, html
+from bootlets.boots_base import Boot
+from bootlets.context import collect_scripts
+from bootlets.funcs import buffered, render_into
+from bootlets.options import options
+
+
+def page():
+    return boots.Container(
+        boots.Alert("Heads up", _context="warning"),
+        boots.Breadcrumb("Home", "Library", "Data"),
+        boots.ListGroup(*[f"item {i}" for i in range(20)], _flush=True),
+        boots.Table(_headers=["a", "b"], _rows=[[i, i * 2] for i in range(20)]),
+        boots.Container("inline", html.B("children"), _inline=True),
+        html.DlDict({"k": "v"}),
+        boots.Modal("body"),
+    )
+
+
+class TestIterDraw(unittest.TestCase):
+    def test_matches_draw(self):
+        obj = page()
+        self.assertEqual("".join(obj.iter_draw()), obj.draw())
+
+    def test_yields_chunks(self):
+        chunks = list(boots.ListGroup("a", "b").iter_draw())
+        self.assertGreater(len(chunks), 1)
+
+    def test_stream_buffers(self):
+        obj = page()
+        chunks = list(obj.stream(size=256))
+        self.assertEqual("".join(chunks), obj.draw())
+        self.assertTrue(all(len(chunk) >= 256 for chunk in chunks[:-1]))
+
+    def test_buffered_empty(self):
+        self.assertEqual(list(buffered([])), [])
+
+
+class TestRenderInto(unittest.TestCase):
+    def test_writers(self):
+        obj = page()
+        expected = obj.draw()
+        self.assertEqual(obj.render_into(io.StringIO()).getvalue(), expected)
+        self.assertEqual("".join(obj.render_into([])), expected)
+        self.assertEqual(obj.render_into(bytearray()).decode("utf-8"), expected)
+        self.assertEqual(
+            render_into(obj, io.BytesIO()).getvalue().decode("utf-8"), expected
+        )
+
+    def test_appends(self):
+        buffer = ["<!DOCTYPE html>"]
+        html.P("é").render_into(buffer)
+        self.assertEqual(buffer[0], "<!DOCTYPE html>")
+        self.assertEqual("".join(buffer[1:]), "<p>é</p>")
+        self.assertEqual(html.P("é").render_into(bytearray()), "<p>é</p>".encode())
+
+    def test_values(self):
+        self.assertEqual(render_into(["a", 1, None], []), ["a", "\n", "1", "\n", "None"])
+
+    def test_whitespace(self):
+        for whitespace in ("minify", "pretty"):
+            with self.subTest(whitespace=whitespace), options(whitespace=whitespace):
+                obj = page()
+                self.assertEqual("".join(obj.render_into([])), obj.draw())
+
+    def test_scripts(self):
+        class Widget(Boot):
+            def build_scripts(self):
+                return [html.Script(src="widget.js")]
+
+        with collect_scripts() as scripts:
+            boots.Container(Widget("a"), Widget("b")).render_into([])
+        self.assertEqual(scripts, ['<script src="widget.js"></script>'])
@@ -0,0 +1,77 @@
+import unittest
+
+from bootlets import boots, html
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def node_table(headers, rows):
+    return html.Table(
+        html.THead(html.Tr(*[html.Th(i, scope="col") for i in headers])),
+        html.TBody(*[html.Tr(*[html.Td(i) for i in row]) for row in rows]),
+        class_="table table-hover",
+    ).draw()
+
+
+class TestTable(unittest.TestCase):
+    headers = ["a", "b", "c"]
+    rows = [[1, "x", html.B("y")], [2, 2.5, None]]
+
+    def test_matches_nodes(self):
+        table = boots.Table(_headers=self.headers, _rows=self.rows)
+        self.assertEqual(table.draw(), node_table(self.headers, self.rows))
+
+    def test_empty(self):
+        self.assertEqual(boots.Table().draw(), node_table([], []))
+
+    def test_generator(self):
+        table = boots.Table(_headers=self.headers, _rows=(row for row in self.rows))
+        chunks = list(table.iter_draw())
+        self.assertEqual("".join(chunks), node_table(self.headers, self.rows))
+
+    def test_formatters(self):
+        table = boots.Table(
+            _headers=["name", "price"],
+            _rows=[("a", 1), ("b", 2.5)],
+            _formatters={"price": "{:.2f}".format, 0: str.upper},
+        )
+        self.assertEqual(
+            table.draw(), node_table(["name", "price"], [("A", "1.00"), ("B", "2.50")])
+        )
+
+    @unittest.skipUnless(numpy, "NumPy is not installed")
+    def test_numpy(self):
+        array = numpy.arange(6).reshape(3, 2)
+        self.assertEqual(
+            boots.Table(_headers=["a", "b"], _rows=array).draw(),
+            node_table(["a", "b"], array.tolist()),
+        )
+        records = numpy.rec.fromrecords([(1, 2.0), (3, 4.0)], names="a,b")
+        self.assertEqual(
+            boots.Table(_rows=records).draw(),
+            node_table(["a", "b"], [(1, 2.0), (3, 4.0)]),
+        )
+        self.assertEqual(
+            boots.Table(_headers=numpy.array(["a", "b"]), _rows=array).draw(),
+            node_table(["a", "b"], array.tolist()),
+        )
+
+    @unittest.skipUnless(pandas, "pandas is not installed")
+    def test_dataframe(self):
+        frame = pandas.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        self.assertEqual(
+            boots.Table(_rows=frame, _formatters={"a": lambda v: v * 10}).draw(),
+            node_table(["a", "b"], [(10, "x"), (20, "y")]),
+        )
+        self.assertEqual(
+            boots.Table(_headers=frame.columns, _rows=frame.values).draw(),
+            node_table(["a", "b"], [(1, "x"), (2, "y")]),
+        )
@@ -0,0 +1,129 @@
+import unittest
+
+from bootlets import boots, html
+from bootlets.options import options
+
+
+def page():
+    return boots.Container(
+        html.Div(html.P("a", "b"), html.UlList("x", "y"), id="main", class_="a b"),
+        "text",
+        boots.Table(_headers=["n"], _rows=[[1], [2]]),
+    )
+
+
+class TestMinify(unittest.TestCase):
+    def setUp(self):
+        context = options(whitespace="minify")
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+    def test_children(self):
+        self.assertEqual(
+            html.Div(html.B("x"), html.I("y"), "z", "w").draw(),
+            "<div><b>x</b> <i>y</i> z w</div>",
+        )
+        self.assertEqual(
+            html.P(html.B("a"), html.I("b")).draw(), "<p><b>a</b> <i>b</i></p>"
+        )
+
+    def test_preformatted(self):
+        self.assertEqual(html.Pre("line1", "line2").draw(), "<pre>line1\nline2</pre>")
+        self.assertEqual(html.TextArea("a", "b").draw(), "<textarea>a\nb</textarea>")
+        self.assertEqual(html.Script("a()", "b()").draw(), "<script>a()\nb()</script>")
+        with options(whitespace="pretty"):
+            self.assertEqual(
+                html.Div(html.Pre("a", "b")).draw(), "<div>\n  <pre>a\nb</pre>\n</div>"
+            )
+
+    def test_optional_end_tags(self):
+        self.assertEqual(html.UlList("a", "b").draw(), "<ul><li>a</li> <li>b</ul>")
+        self.assertEqual(
+            html.Dl(html.Dt("a"), html.Dd("b")).draw(), "<dl><dt>a</dt> <dd>b</dl>"
+        )
+        self.assertEqual(html.Dl(html.Dt("a")).draw(), "<dl><dt>a</dt></dl>")
+        self.assertEqual(
+            html.Div(html.Li("a"), html.P("x")).draw(), "<div><li>a</li> <p>x</p></div>"
+        )
+        self.assertEqual(
+            html.Tr(html.Td("1"), html.Td("2")).draw(), "<tr><td>1<td>2</tr>"
+        )
+        self.assertEqual(html.P("a").draw(), "<p>a</p>")
+
+    def test_attributes(self):
+        self.assertEqual(
+            html.Div(id="x", class_="a b", title="", data_x='"').draw(),
+            '<div id=x class="a b" title data-x="""></div>',
+        )
+
+    def test_table_rows(self):
+        self.assertIn(
+            "<tbody><tr><td>1<td>2<tr><td>3<td>4</table>",
+            boots.Table(_rows=[[1, 2], [3, 4]]).draw(),
+        )
+
+    def test_stream(self):
+        self.assertEqual("".join(page().stream(1)), page().draw())
+
+
+class TestPretty(unittest.TestCase):
+    def setUp(self):
+        context = options(whitespace="pretty")
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+    def test_indent(self):
+        self.assertEqual(
+            html.Div(html.P("a"), html.Ul(html.Li("b"), html.Li(html.B("c")))).draw(),
+            "<div>\n"
+            "  <p>a</p>\n"
+            "  <ul>\n"
+            "    <li>b</li>\n"
+            "    <li>\n"
+            "      <b>c</b>\n"
+            "    </li>\n"
+            "  </ul>\n"
+            "</div>",
+        )
+
+    def test_table_rows(self):
+        self.assertIn(
+            "  <tbody>\n"
+            "    <tr>\n"
+            "      <td>1</td>\n"
+            "      <td>2</td>\n"
+            "    </tr>\n"
+            "  </tbody>\n",
+            boots.Table(_rows=[[1, 2]]).draw(),
+        )
+
+    def test_fragment_cache_keyed_on_depth(self):
+        cached = html.P(html.B("x"), _cache=True)
+        self.assertEqual(
+            html.Div(html.Div(cached), cached).draw(),
+            "<div>\n"
+            "  <div>\n"
+            "    <p>\n"
+            "      <b>x</b>\n"
+            "    </p>\n"
+            "  </div>\n"
+            "  <p>\n"
+            "    <b>x</b>\n"
+            "  </p>\n"
+            "</div>",
+        )
+
+    def test_stream(self):
+        self.assertEqual("".join(page().stream(1)), page().draw())
+
+
+class TestOptions(unittest.TestCase):
+    def test_default_unchanged(self):
+        self.assertEqual(
+            html.UlList("a", "b").draw(), "<ul><li>a</li>\n<li>b</li></ul>"
+        )
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            with options(whitespace="compact"):
+                pass